@@ -3,7 +3,9 @@ BAI Transformer - Transforms BAI2 data to BigQuery rows
 Inherits from BaseTransformer
 """
 import logging
+import operator
 import re
+import sys
 from typing import List, Dict, Any, Optional, Tuple
 
 from common.base_transformer import BaseTransformer
@@ -12,6 +14,31 @@ from BAI.src.bai2_core.models.bai2_model import Bai2File
 
 logger = logging.getLogger(__name__)
 
+# Compiled once; BAI text fields are ASCII so re.ASCII keeps \b/\d on the fast path
+ACCOUNT_DASHED_PATTERN = re.compile(r'\b(\d{2,3}-\d{4}-\d{7,12}-\d{2,3})\b', re.ASCII)
+ACCOUNT_NUMERIC_PATTERN = re.compile(r'\b(\d{6,16})\b', re.ASCII)
+SWIFT_PATTERN = re.compile(r'\b([A-Z]{6}[A-Z0-9]{2}(?:[A-Z0-9]{3})?)\b', re.ASCII)
+
+# Fixed key order for transaction rows so every row dict shares the same layout
+TRANSACTION_ROW_KEYS = (
+    "organisation_biz_id",
+    "division_biz_id",
+    "source_system",
+    "_target_table",
+    "account_number",
+    "bsb",
+    "financial_institute",
+    "currency",
+    "transaction_posting_date",
+    "transaction_value_date",
+    "transaction_amount",
+    "transaction_type",
+    "swift_transaction_code",
+    "counterparty_account_number",
+    "counterparty_account_bsb",
+    "counterparty_financial_institute",
+)
+
 
 class BAITransformer(BaseTransformer):
     """Transforms BAI2 files into schema-compliant BigQuery rows."""
@@ -35,6 +62,19 @@ class BAITransformer(BaseTransformer):
         self.swift_code_patterns = self.config.get("SWIFT_CODE_PATTERNS", {})
         self.code_map = self._load_code_mappings()
         
+        # Per-table rule views, resolved once instead of re-filtering code_map per row
+        self._tx_rules = tuple(
+            (rule["bai_field"], rule["bq_column"], rule["bq_column"] == "transaction_amount")
+            for rule in self.code_map.values() if rule["table"] == "transactions"
+        )
+        tx_fields = tuple(bai_field for bai_field, _, _ in self._tx_rules)
+        # Single C-level fetch of all mapped transaction attributes
+        self._tx_getter = operator.attrgetter(*tx_fields) if tx_fields else None
+        self._bal_rules = {
+            code: (rule["bai_field"], rule["bq_column"])
+            for code, rule in self.code_map.items() if rule["table"] == "balance"
+        }
+        
         logger.info(f"BAITransformer initialized with bank_id: {bank_id}")
     
     def transform(self, parsed_data: Bai2File, table_type: str = None) -> List[Dict]:
@@ -51,6 +91,8 @@ class BAITransformer(BaseTransformer):
         logger.info("Transforming BAI2 file")
         
         all_rows = []
+        balance_count = 0
+        tx_count = 0
         
         # Extract SWIFT code at file level
         financial_institute_swift = self._extract_financial_institute_swift(parsed_data)
@@ -62,10 +104,12 @@ class BAITransformer(BaseTransformer):
             if not group_date:
                 logger.warning("Skipping group without as_of_date")
                 continue
+            group_date_iso = group_date.isoformat()
             
             # Process each account
             for account in group.children:
                 account_number = account.header.customer_account_number
+                currency = account.header.currency or " "
                 bsb = self._extract_bsb_from_account(
                     account.header, group, financial_institute_swift
                 )
@@ -74,22 +118,22 @@ class BAITransformer(BaseTransformer):
                 
                 # Create balance row
                 balance_row = self._create_balance_row(
-                    account, group_date, bsb, account_number, financial_institute_swift
+                    account, group_date_iso, bsb, account_number, financial_institute_swift, currency
                 )
-                all_rows.append(balance_row)
+                # Each row list targets one table, so defaults are applied without per-row dispatch
+                all_rows.extend(self.apply_table_defaults([balance_row], BALANCE_TABLE_ID))
+                balance_count += 1
                 
                 # Create transaction rows
                 transaction_rows = self._create_transaction_rows(
-                    account, group_date, bsb, account_number, financial_institute_swift
+                    account, group_date_iso, bsb, account_number, financial_institute_swift, currency
                 )
-                all_rows.extend(transaction_rows)
+                all_rows.extend(self.apply_table_defaults(transaction_rows, TRANSACTIONS_TABLE_ID))
+                tx_count += len(transaction_rows)
         
-        balance_count = sum(1 for r in all_rows if r["_target_table"] == BALANCE_TABLE_ID)
-        tx_count = sum(1 for r in all_rows if r["_target_table"] == TRANSACTIONS_TABLE_ID)
         logger.info(f"Transformed {len(all_rows)} rows: {balance_count} balances, {tx_count} transactions")
         
-        # Apply default values before returning
-        return self.apply_default_values(all_rows)
+        return all_rows
     
     def _load_code_mappings(self) -> Dict:
         """Load bank-specific code mappings or default mappings."""
@@ -97,91 +141,130 @@ class BAITransformer(BaseTransformer):
         if self.bank_id:
             for mapping in self.config.get("mappings", []):
                 if mapping.get("bank_id") == self.bank_id:
-                    return {m["bai_code"]: m for m in mapping["mappings"]}
+                    return {m["bai_code"]: self._intern_rule(m) for m in mapping["mappings"]}
         
         # Fallback to default mappings
         default_mappings = self.config.get("bank_id_default_typecodes", [])
-        return {m["bai_code"]: m for m in default_mappings}
+        return {m["bai_code"]: self._intern_rule(m) for m in default_mappings}
     
-    def _create_balance_row(self, account, group_date, bsb, account_number, fi_swift) -> Dict:
+    @staticmethod
+    def _intern_rule(rule: Dict) -> Dict:
+        """Copy a mapping rule with its column/field names interned (they become row keys)."""
+        return {
+            **rule,
+            "bai_field": sys.intern(rule["bai_field"]),
+            "bq_column": sys.intern(rule["bq_column"]),
+        }
+    
+    def _create_balance_row(self, account, group_date_iso, bsb, account_number, fi_swift, currency) -> Dict:
         """Create balance table row from account summary."""
-        row = self._get_common_fields()
-        row.update({
+        row = {
+            **self._get_common_fields(),
             "_target_table": BALANCE_TABLE_ID,
             "account_number": account_number,
             "bsb": bsb,
             "financial_institute": fi_swift,
-            "balance_date": group_date.isoformat(),
-            "currency": account.header.currency or " "
-        })
+            "balance_date": group_date_iso,
+            "currency": currency
+        }
         
         # Map summary items to balance fields
         for summary in account.header.summary_items or []:
             code = summary.type_code.code if summary.type_code else None
-            if code and code in self.code_map:
-                rule = self.code_map[code]
-                if rule["table"] == "balance":
-                    row[rule["bq_column"]] = getattr(summary, rule["bai_field"], None)
+            if code and code in self._bal_rules:
+                bai_field, bq_column = self._bal_rules[code]
+                row[bq_column] = getattr(summary, bai_field, None)
         
         return row
     
-    def _create_transaction_rows(self, account, group_date, bsb, account_number, fi_swift) -> List[Dict]:
+    def _create_transaction_rows(self, account, group_date_iso, bsb, account_number, fi_swift, currency) -> List[Dict]:
         """Create transaction table rows from account transactions."""
         rows = []
         
+        # Account-level template; each transaction row is a copy with the same key layout
+        template = dict.fromkeys(TRANSACTION_ROW_KEYS)
+        template.update(self._get_common_fields())
+        template["_target_table"] = TRANSACTIONS_TABLE_ID
+        template["account_number"] = account_number
+        template["bsb"] = bsb
+        template["financial_institute"] = fi_swift
+        template["currency"] = currency
+        
         for tx in getattr(account, "children", []):
-            row = self._get_common_fields()
-            row.update({
-                "_target_table": TRANSACTIONS_TABLE_ID,
-                "account_number": account_number,
-                "bsb": bsb,
-                "financial_institute": fi_swift,
-                "currency": account.header.currency or " ",
-                "transaction_posting_date": getattr(tx, "posting_date", group_date).isoformat(),
-                "transaction_value_date": getattr(tx, "value_date", group_date).isoformat()
-            })
-            
-            # Extract type code
-            tx_type_code = None
-            tx_type_code_obj = None
-            if hasattr(tx, 'type_code') and tx.type_code:
-                tx_type_code_obj = tx.type_code
-                tx_type_code = tx.type_code.code if hasattr(tx.type_code, 'code') else str(tx.type_code)
-            
-            # Map transaction fields
-            for code, rule in self.code_map.items():
-                if rule["table"] != "transactions":
-                    continue
-                value = getattr(tx, rule["bai_field"], None)
-                if value is not None:
-                    row[rule["bq_column"]] = value
-                    
-                    # Set transaction type
-                    if rule["bq_column"] == "transaction_amount" and hasattr(tx, 'type_code'):
-                        if hasattr(tx.type_code, 'transaction') and tx.type_code.transaction:
-                            row["transaction_type"] = "D" if tx.type_code.transaction.value == "debit" else "C"
-                        else:
-                            row["transaction_type"] = "D"
-            
-            # Extract SWIFT code
-            swift_code = self._extract_swift_code(tx_type_code, tx_type_code_obj)
-            row["swift_transaction_code"] = swift_code or ""
-            
-            # Extract counterparty information
-            counterparty_account, counterparty_bsb, counterparty_swift = self._extract_counterparty_info(tx)
-            row["counterparty_account_number"] = counterparty_account
-            row["counterparty_account_bsb"] = counterparty_bsb
-            row["counterparty_financial_institute"] = counterparty_swift
-            
-            # Ensure required fields
-            if "transaction_amount" not in row or row["transaction_amount"] is None:
-                row["transaction_amount"] = 0
-                row["transaction_type"] = "D"
-            
-            rows.append(row)
+            rows.append(self._build_tx_row(tx, template, group_date_iso))
         
         return rows
     
+    def _build_tx_row(self, tx, template: Dict[str, Any], group_date_iso: str) -> Dict[str, Any]:
+        """Build a single transaction row from the account-level template."""
+        posting_date = getattr(tx, "posting_date", None)
+        value_date = getattr(tx, "value_date", None)
+        # Dates are template keys, so the display keeps the template's key layout
+        row = {
+            **template,
+            "transaction_posting_date": posting_date.isoformat() if posting_date else group_date_iso,
+            "transaction_value_date": value_date.isoformat() if value_date else group_date_iso,
+        }
+        
+        # Extract type code
+        tx_type_code = None
+        has_type_code = hasattr(tx, 'type_code')
+        tx_type_code_obj = tx.type_code if has_type_code else None
+        if tx_type_code_obj:
+            try:
+                tx_type_code = tx_type_code_obj.code
+            except AttributeError:
+                tx_type_code = str(tx_type_code_obj)
+        
+        # Transaction type follows the type code, whichever amount field is mapped;
+        # it is left unset for transactions without a type_code attribute
+        type_code_transaction = getattr(tx_type_code_obj, 'transaction', None)
+        if not has_type_code:
+            transaction_type = None
+        elif type_code_transaction:
+            transaction_type = "D" if type_code_transaction.value == "debit" else "C"
+        else:
+            transaction_type = "D"
+        
+        # Map transaction fields
+        for (_, bq_column, is_amount), value in zip(self._tx_rules, self._get_tx_values(tx)):
+            if value is not None:
+                row[bq_column] = value
+                
+                # Set transaction type
+                if is_amount and transaction_type is not None:
+                    row["transaction_type"] = transaction_type
+        
+        # Extract SWIFT code
+        swift_code = self._extract_swift_code(tx_type_code, tx_type_code_obj)
+        row["swift_transaction_code"] = swift_code or ""
+        
+        # Extract counterparty information
+        counterparty_account, counterparty_bsb, counterparty_swift = self._extract_counterparty_info(tx)
+        row["counterparty_account_number"] = counterparty_account
+        row["counterparty_account_bsb"] = counterparty_bsb
+        row["counterparty_financial_institute"] = counterparty_swift
+        
+        # Ensure required fields
+        if row["transaction_amount"] is None:
+            row["transaction_amount"] = 0
+            row["transaction_type"] = "D"
+        elif transaction_type is None:
+            # No type_code to derive it from: the column is left out, not set to None
+            del row["transaction_type"]
+        
+        return row
+    
+    def _get_tx_values(self, tx) -> Tuple:
+        """Fetch mapped transaction attribute values in rule order."""
+        if self._tx_getter is None:
+            return ()
+        try:
+            values = self._tx_getter(tx)
+        except AttributeError:
+            return tuple(getattr(tx, bai_field, None) for bai_field, _, _ in self._tx_rules)
+        return values if len(self._tx_rules) > 1 else (values,)
+    
     def _extract_swift_code(self, type_code: str, type_code_obj) -> Optional[str]:
         """Extract SWIFT code using two-tier strategy."""
         # Strategy 1: Direct BAI to SWIFT mapping
@@ -189,8 +272,8 @@ class BAITransformer(BaseTransformer):
             return self.bai_to_swift_map[type_code]
         
         # Strategy 2: Match keywords in description
-        if type_code_obj and hasattr(type_code_obj, 'description'):
-            description = type_code_obj.description
+        if type_code_obj:
+            description = getattr(type_code_obj, 'description', None)
             if description:
                 description_upper = description.upper()
                 for swift_code, pattern_info in self.swift_code_patterns.items():
@@ -207,31 +290,30 @@ class BAITransformer(BaseTransformer):
         # Build combined text
         text_parts = []
         for attr in ['text', 'bank_reference', 'customer_reference']:
-            if hasattr(tx, attr) and getattr(tx, attr):
-                text_parts.append(str(getattr(tx, attr)))
+            value = getattr(tx, attr, None)
+            if value:
+                text_parts.append(str(value))
         combined_text = " ".join(text_parts)
+        upper_text = combined_text.upper()
         
         # Get SWIFT mapping
         swift_to_bank_map = self.config.get("SWIFT_TO_BANK", [{}])[0] if self.config.get("SWIFT_TO_BANK") else {}
         
-        # Extract account number patterns
-        account_pattern_1 = r'\b(\d{2,3}-\d{4}-\d{7,12}-\d{2,3})\b'
-        account_pattern_2 = r'\b(\d{6,16})\b'
-        
         account_number = ""
         bsb = ""
         
         # Try dashed format first
-        match = re.search(account_pattern_1, combined_text)
+        match = ACCOUNT_DASHED_PATTERN.search(combined_text)
         if match:
             account_number = match.group(1)
-            digits_only = re.sub(r'\D', '', account_number)
+            # Dashed pattern only matches digits and '-', so stripping dashes leaves the digits
+            digits_only = account_number.replace('-', '')
             if len(digits_only) >= 6:
                 bsb = digits_only[:6]
         
         # Try numeric format
         if not account_number:
-            matches = re.finditer(account_pattern_2, combined_text)
+            matches = ACCOUNT_NUMERIC_PATTERN.finditer(combined_text)
             for match in matches:
                 potential_account = match.group(1)
                 if 8 <= len(potential_account) <= 16:
@@ -241,17 +323,16 @@ class BAITransformer(BaseTransformer):
                     break
         
         # Extract SWIFT code
-        swift_code = self._extract_swift_from_text(combined_text, swift_to_bank_map)
+        swift_code = self._extract_swift_from_text(upper_text, swift_to_bank_map, preuppered=True)
         
         return account_number, bsb, swift_code
     
-    def _extract_swift_from_text(self, text: str, swift_map: Dict) -> str:
-        """Extract SWIFT code from text."""
+    def _extract_swift_from_text(self, text: str, swift_map: Dict, preuppered: bool = False) -> str:
+        """Extract SWIFT code from text (pass preuppered=True if text is already uppercase)."""
         if not text:
             return ""
         
-        swift_pattern = r'\b([A-Z]{6}[A-Z0-9]{2}(?:[A-Z0-9]{3})?)\b'
-        match = re.search(swift_pattern, text.upper())
+        match = SWIFT_PATTERN.search(text if preuppered else text.upper())
         
         if match:
             swift_code = match.group(1)
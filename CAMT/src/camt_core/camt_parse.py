@@ -1,13 +1,54 @@
 """
 Main entry points for CAMT.053 parsing
 """
-import xml.etree.ElementTree as ET
 import logging
-from typing import Optional
+from io import RawIOBase
+from typing import BinaryIO, Optional, Tuple, Union
+
+try:
+    from lxml import etree as ET
+    # Drop whitespace-only text nodes and skip the ID table - neither is used by the parsers
+    _XML_PARSER = ET.XMLParser(remove_blank_text=True, huge_tree=True, collect_ids=False)
+    # Decoded strings have already lost their original encoding, so pin UTF-8 for them
+    _XML_STRING_PARSER = ET.XMLParser(remove_blank_text=True, huge_tree=True, collect_ids=False,
+                                      encoding='utf-8')
+except ImportError:  # lxml not available - stdlib ElementTree offers the same parse API
+    import xml.etree.ElementTree as ET
+    _XML_PARSER = None
+    _XML_STRING_PARSER = None
 from CAMT.src.camt_core.models.camt_model import BankToCustomerStatement
-from CAMT.src.camt_core.parser_document import DocumentParser
+from CAMT.src.camt_core.parser_document import DetailLevel, DocumentParser
 from CAMT.src.camt_core.utils.parser_utils import extract_namespace
 
+# Bytes read at a time while looking for the root start tag of a stream
+_SNIFF_CHUNK_SIZE = 4096
+
+
+class _HeadedStream(RawIOBase):
+    """
+    Binary stream that replays bytes already read from a source before the rest of it
+    
+    Lets the namespace sniff and the document parse share a single pass over
+    a stream that is expensive to rewind, such as a GCS blob reader.
+    """
+    
+    def __init__(self, head: bytes, source: BinaryIO):
+        self._head = memoryview(head)
+        self._source = source
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        if self._head:
+            size = min(len(buffer), len(self._head))
+            buffer[:size] = self._head[:size]
+            self._head = self._head[size:]
+            return size
+        data = self._source.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
 
 class CAMT053Parser:
     """Parser for simplified CAMT.053 XML files"""
@@ -31,21 +72,78 @@ class CAMT053Parser:
             ValueError: If XML parsing fails
         """
         try:
-            tree = ET.parse(file_path)
+            tree = ET.parse(file_path, _XML_PARSER)
             root = tree.getroot()
             return self._parse_document(root)
-        except ET.ParseError as e:
+        except SyntaxError as e:  # ElementTree and lxml parse errors both derive from SyntaxError
+            raise ValueError(f"XML parsing error: {str(e)}")
+        except Exception as e:
+            self.logger.error(f"Error parsing file {file_path}: {str(e)}")
+            raise
+    
+    def parse_file_stream(self, file_path: str) -> BankToCustomerStatement:
+        """
+        Parse CAMT.053 XML from file path incrementally
+        
+        Keeps memory bounded for large statements by streaming entries
+        instead of building the whole tree.
+        
+        Args:
+            file_path: Path to XML file
+            
+        Returns:
+            BankToCustomerStatement object
+            
+        Raises:
+            ValueError: If XML parsing fails
+        """
+        try:
+            with open(file_path, 'rb') as source:
+                return self._parse_stream(source)
+        except SyntaxError as e:  # ElementTree and lxml parse errors both derive from SyntaxError
             raise ValueError(f"XML parsing error: {str(e)}")
         except Exception as e:
             self.logger.error(f"Error parsing file {file_path}: {str(e)}")
             raise
     
-    def parse_string(self, xml_string: str) -> BankToCustomerStatement:
+    def parse_stream(self, source: BinaryIO, head: bytes = b'',
+                     detail_level: DetailLevel = 'full') -> BankToCustomerStatement:
+        """
+        Parse CAMT.053 XML incrementally from a binary stream
+        
+        The stream is read once, front to back, and never rewound.
+        
+        Args:
+            source: Binary file object (e.g. a GCS blob reader); it is not closed
+            head: Bytes the caller has already read from the start of source,
+                which is positioned right after them
+            detail_level: How much of each statement to parse (see
+                DocumentParser.parse_document_stream)
+            
+        Returns:
+            BankToCustomerStatement object
+            
+        Raises:
+            ValueError: If XML parsing fails
+        """
+        try:
+            return self._parse_stream(source, head, detail_level)
+        except SyntaxError as e:
+            raise ValueError(f"XML parsing error: {str(e)}")
+        except Exception as e:
+            self.logger.error(f"Error parsing XML stream: {str(e)}")
+            raise
+    
+    def parse_string(self, xml_string: Union[str, bytes], parallel: bool = False,
+                     detail_level: DetailLevel = 'full') -> BankToCustomerStatement:
         """
         Parse CAMT.053 XML from string
         
         Args:
-            xml_string: XML content as string
+            xml_string: XML content as string or raw bytes
+            parallel: Parse statements in a process pool when there are several
+            detail_level: How much of each statement to parse (see
+                DocumentParser.parse_document)
             
         Returns:
             BankToCustomerStatement object
@@ -54,20 +152,72 @@ class CAMT053Parser:
             ValueError: If XML parsing fails
         """
         try:
-            root = ET.fromstring(xml_string)
-            return self._parse_document(root)
-        except ET.ParseError as e:
+            if _XML_PARSER is None:
+                root = ET.fromstring(xml_string)
+            elif isinstance(xml_string, str):
+                root = ET.fromstring(xml_string.encode('utf-8'), _XML_STRING_PARSER)
+            else:
+                root = ET.fromstring(xml_string, _XML_PARSER)
+            return self._parse_document(root, parallel, detail_level)
+        except SyntaxError as e:  # ElementTree and lxml parse errors both derive from SyntaxError
             raise ValueError(f"XML parsing error: {str(e)}")
         except Exception as e:
             self.logger.error(f"Error parsing XML string: {str(e)}")
             raise
     
-    def _parse_document(self, root: ET.Element) -> BankToCustomerStatement:
+    def _parse_stream(self, source: BinaryIO, head: bytes = b'',
+                      detail_level: DetailLevel = 'full') -> BankToCustomerStatement:
+        """
+        Initialize document parser from the root namespace and stream the document
+        
+        Args:
+            source: Binary file object positioned right after head
+            head: Bytes already read from the start of the document
+            detail_level: How much of each statement to parse
+            
+        Returns:
+            BankToCustomerStatement object
+        """
+        head, self.namespace = self._sniff_namespace(source, head)
+        self.doc_parser = DocumentParser(self.namespace, self.logger)
+        return self.doc_parser.parse_document_stream(_HeadedStream(head, source), detail_level)
+    
+    @staticmethod
+    def _sniff_namespace(source: BinaryIO, head: bytes = b'') -> Tuple[bytes, str]:
+        """
+        Read the namespace from the root start tag without parsing the body
+        
+        Feeds head, then further chunks of source, to a pull parser until the
+        root start tag has been seen.
+        
+        Args:
+            source: Binary file object positioned right after head
+            head: Bytes already read from the start of the document
+            
+        Returns:
+            (all bytes read from the start so far, namespace string like
+            '{http://...}' or empty string)
+        """
+        pull_parser = ET.XMLPullParser(events=('start',))
+        chunk = head or source.read(_SNIFF_CHUNK_SIZE)
+        head = chunk
+        while chunk:
+            pull_parser.feed(chunk)
+            for _, elem in pull_parser.read_events():
+                return head, extract_namespace(elem)
+            chunk = source.read(_SNIFF_CHUNK_SIZE)
+            head += chunk
+        return head, ''
+    
+    def _parse_document(self, root: ET.Element, parallel: bool = False,
+                        detail_level: DetailLevel = 'full') -> BankToCustomerStatement:
         """
         Initialize document parser and parse the document
         
         Args:
             root: Root XML element
+            parallel: Parse statements in a process pool when there are several
+            detail_level: How much of each statement to parse
             
         Returns:
             BankToCustomerStatement object
@@ -79,4 +229,4 @@ class CAMT053Parser:
         self.doc_parser = DocumentParser(self.namespace, self.logger)
         
         # Delegate to document parser
-        return self.doc_parser.parse_document(root)
\ No newline at end of file
+        return self.doc_parser.parse_document(root, parallel=parallel, detail_level=detail_level)
\ No newline at end of file
@@ -1,8 +1,8 @@
 """
 CAMT.053.001.02 Data Models - Updated with Account Details
 """
-from dataclasses import dataclass, field
-from typing import List, Optional
+from dataclasses import InitVar, dataclass, field
+from typing import Callable, List, Optional
 from datetime import datetime, date
 from decimal import Decimal
 from enum import Enum
@@ -62,7 +62,7 @@ class Account:
             raise ValueError("Currency must be a 3-character ISO code")
 
 
-@dataclass
+@dataclass(slots=True)
 class Balance:
     """Balance information"""
     type: BalanceType
@@ -77,7 +77,7 @@ class Balance:
             raise ValueError("Amount must be positive")
 
 
-@dataclass
+@dataclass(slots=True)
 class TransactionSummary:
     """Transaction summary totals"""
     total_entries_count: int
@@ -99,7 +99,7 @@ class TransactionSummary:
             raise ValueError("Total entries sum mismatch")
 
 
-@dataclass
+@dataclass(slots=True)
 class BankTransactionCode:
     """Bank transaction code structure"""
     domain_code: str
@@ -109,7 +109,7 @@ class BankTransactionCode:
     issuer: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TransactionReferences:
     """Transaction reference identifiers"""
     instruction_id: Optional[str] = None
@@ -120,14 +120,14 @@ class TransactionReferences:
     account_servicer_ref: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PartyAccount:
     """Account information for a party (creditor/debtor)"""
     account_id: Optional[str] = None  # Full account number
     bsb: Optional[str] = None  # BSB extracted from account_id or separately provided
 
 
-@dataclass
+@dataclass(slots=True)
 class RelatedParty:
     """Related party information with account details"""
     name: Optional[str] = None
@@ -136,20 +136,20 @@ class RelatedParty:
     contact_details: Optional[dict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RemittanceInformation:
     """Remittance information"""
     unstructured: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReturnInformation:
     """Return/reversal information"""
     reason_code: Optional[str] = None
     additional_info: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TransactionDetails:
     """Detailed transaction information"""
     references: TransactionReferences
@@ -178,18 +178,36 @@ class Entry:
     value_date: date
     bank_transaction_code: BankTransactionCode
     transaction_details: List[TransactionDetails] = field(default_factory=list)
+    # Builds transaction_details on the first load_details() call when they are parsed lazily
+    details_loader: InitVar[Optional[Callable[[], List[TransactionDetails]]]] = None
+    _details_loader: Optional[Callable[[], List[TransactionDetails]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
-    def __post_init__(self):
+    def __post_init__(self, details_loader):
         if not self.entry_reference:
             raise ValueError("Entry reference is required")
         if self.amount is None or self.amount < 0:
             raise ValueError("Amount must be positive")
-        if not self.transaction_details:
+        if not self.transaction_details and details_loader is None:
             raise ValueError("At least one transaction detail is required")
+        self._details_loader = details_loader
+    
+    def load_details(self) -> List[TransactionDetails]:
+        """
+        Get transaction details, running the lazy loader on the first call
+        
+        transaction_details stays empty for lazily parsed entries until this
+        has been called.
+        """
+        if self._details_loader is not None:
+            self.transaction_details = self._details_loader()
+            self._details_loader = None
+        return self.transaction_details
     
     def is_debulked(self) -> bool:
         """Check if entry has multiple transaction details (debulked)"""
-        return len(self.transaction_details) > 1
+        return len(self.load_details()) > 1
 
 
 @dataclass
@@ -2,46 +2,278 @@
 Document Structure, Statement Level, Entry Parsing, and Transaction Details
 Handles all core parsing logic for CAMT.053 documents
 """
-import xml.etree.ElementTree as ET
 import logging
-from typing import List, Optional
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Iterable, List, Literal, Optional
+from datetime import date, datetime
 from decimal import Decimal
 
+try:
+    from lxml import etree as ET
+    _HAS_LXML = True
+except ImportError:  # lxml not available - stdlib ElementTree offers the same find API
+    import xml.etree.ElementTree as ET
+    _HAS_LXML = False
+
 from CAMT.src.camt_core.models.camt_model import (
     BankToCustomerStatement, GroupHeader, Statement, Account,
     FinancialInstitution, Balance, BalanceType, TransactionSummary,
-    Entry, TransactionDetails, BankTransactionCode, CreditDebitIndicator
+    Entry, TransactionDetails, TransactionReferences, BankTransactionCode,
+    CreditDebitIndicator
 )
 from CAMT.src.camt_core.utils.camt_helper import HelperParsers
-from CAMT.src.camt_core.utils.parser_utils import get_text, parse_datetime, parse_date
+from CAMT.src.camt_core.utils.parser_utils import (
+    CompiledPath, child_text, collect_children, element_to_bytes, get_text, iter_children,
+    parse_datetime, parse_date
+)
+
+
+@lru_cache(maxsize=8192)
+def _dec(value: str) -> Decimal:
+    """Decimal for an amount string; amounts repeat heavily across entries"""
+    return Decimal(value)
+
+
+_BAL_TYPE_MAP = {
+    'OPBD': BalanceType.OPENING,
+    'CLBD': BalanceType.CLOSING,
+    'CLAV': BalanceType.AVAILABLE
+}
+_BAL_TYPES_ALL = (BalanceType.OPENING, BalanceType.CLOSING, BalanceType.AVAILABLE)
+
+_CREDIT = CreditDebitIndicator.CREDIT
+
+# Anything other than CRDT is treated as a debit
+_CDT_IND = {'CRDT': _CREDIT}.get
+
+# How much of each statement to build: summaries only, entries without
+# transaction details, entries with details parsed on first access, or everything
+DetailLevel = Literal['summary', 'entries', 'lazy', 'full']
+_DETAIL_LEVELS = ('summary', 'entries', 'lazy', 'full')
 
 
 class DocumentParser:
     """Handles parsing of CAMT.053 document structure"""
     
+    # Multi-step child paths, compiled once per namespace (see _get_compiled_paths)
+    _PATHS = {
+        'acct_id': ('Id', 'Othr', 'Id'),
+        'acct_bicfi': ('Svcr', 'FinInstnId', 'BICFI'),
+        'acct_bic': ('Svcr', 'FinInstnId', 'BIC'),
+    }
+    
+    # namespace -> {name: CompiledPath}, shared by all parsers of the same namespace
+    _compiled_paths = {}
+    
     def __init__(self, namespace: str, logger: logging.Logger):
         self.namespace = namespace
         self.logger = logger
         self.helper_parsers = HelperParsers(namespace, logger)
+        
+        # Namespaced tags read by this parser
+        self._t_acct = f'{namespace}Acct'
+        self._t_addtlinf = f'{namespace}AddtlInf'
+        self._t_addtltxinf = f'{namespace}AddtlTxInf'
+        self._t_amt = f'{namespace}Amt'
+        self._t_bal = f'{namespace}Bal'
+        self._t_bktocstmrstmt = f'{namespace}BkToCstmrStmt'
+        self._t_bktxcd = f'{namespace}BkTxCd'
+        self._t_bookgdt = f'{namespace}BookgDt'
+        self._t_ccy = f'{namespace}Ccy'
+        self._t_cd = f'{namespace}Cd'
+        self._t_cdtdbtind = f'{namespace}CdtDbtInd'
+        self._t_cdtr = f'{namespace}Cdtr'
+        self._t_cdtracct = f'{namespace}CdtrAcct'
+        self._t_cdtragt = f'{namespace}CdtrAgt'
+        self._t_credttm = f'{namespace}CreDtTm'
+        self._t_dbtr = f'{namespace}Dbtr'
+        self._t_dbtracct = f'{namespace}DbtrAcct'
+        self._t_dbtragt = f'{namespace}DbtrAgt'
+        self._t_domn = f'{namespace}Domn'
+        self._t_dt = f'{namespace}Dt'
+        self._t_elctrncseqnb = f'{namespace}ElctrncSeqNb'
+        self._t_fmly = f'{namespace}Fmly'
+        self._t_frdttm = f'{namespace}FrDtTm'
+        self._t_frtodt = f'{namespace}FrToDt'
+        self._t_grphdr = f'{namespace}GrpHdr'
+        self._t_id = f'{namespace}Id'
+        self._t_issr = f'{namespace}Issr'
+        self._t_msgid = f'{namespace}MsgId'
+        self._t_nbofntries = f'{namespace}NbOfNtries'
+        self._t_ntry = f'{namespace}Ntry'
+        self._t_ntrydtls = f'{namespace}NtryDtls'
+        self._t_ntryref = f'{namespace}NtryRef'
+        self._t_prtry = f'{namespace}Prtry'
+        self._t_refs = f'{namespace}Refs'
+        self._t_rltdagts = f'{namespace}RltdAgts'
+        self._t_rltdpties = f'{namespace}RltdPties'
+        self._t_rmtinf = f'{namespace}RmtInf'
+        self._t_rtrinf = f'{namespace}RtrInf'
+        self._t_stmt = f'{namespace}Stmt'
+        self._t_sts = f'{namespace}Sts'
+        self._t_subfmlycd = f'{namespace}SubFmlyCd'
+        self._t_sum = f'{namespace}Sum'
+        self._t_todttm = f'{namespace}ToDtTm'
+        self._t_tp = f'{namespace}Tp'
+        self._t_ttlcdtntries = f'{namespace}TtlCdtNtries'
+        self._t_ttldbtntries = f'{namespace}TtlDbtNtries'
+        self._t_ttlnetntryamt = f'{namespace}TtlNetNtryAmt'
+        self._t_ttlntries = f'{namespace}TtlNtries'
+        self._t_txdtls = f'{namespace}TxDtls'
+        self._t_txssummry = f'{namespace}TxsSummry'
+        self._t_valdt = f'{namespace}ValDt'
+        self._p_bal_type_cd = f'{namespace}CdOrPrtry/{namespace}Cd'
+        
+        paths = self._get_compiled_paths(namespace)
+        self._xp_acct_id = paths['acct_id']
+        self._xp_acct_bicfi = paths['acct_bicfi']
+        self._xp_acct_bic = paths['acct_bic']
+        
+        # Parsed BkTxCd values keyed by their codes; statements repeat a handful of codes
+        self._bktxcd_cache = {}
+        
+        # Direct children read by the single-pass child sweeps
+        self._stmt_header_tags = frozenset(
+            f'{namespace}{tag}' for tag in (
+                'Id', 'ElctrncSeqNb', 'CreDtTm', 'FrToDt', 'Acct', 'TxsSummry'
+            )
+        )
+        self._bal_tags = frozenset(
+            f'{namespace}{tag}' for tag in ('Tp', 'Amt', 'CdtDbtInd', 'Dt')
+        )
+        self._summary_tags = frozenset(
+            f'{namespace}{tag}' for tag in ('TtlNtries', 'TtlCdtNtries', 'TtlDbtNtries')
+        )
+        self._summary_total_tags = frozenset(
+            f'{namespace}{tag}' for tag in ('NbOfNtries', 'Sum', 'TtlNetNtryAmt', 'CdtDbtInd')
+        )
+        self._entry_tags = frozenset(
+            f'{namespace}{tag}' for tag in (
+                'NtryRef', 'Amt', 'CdtDbtInd', 'Sts', 'BookgDt', 'ValDt', 'BkTxCd'
+            )
+        )
+    
+    @classmethod
+    def _get_compiled_paths(cls, namespace: str) -> dict:
+        """
+        Compile the registered paths for a namespace once
+        
+        Args:
+            namespace: Namespace string like '{http://...}'
+            
+        Returns:
+            Dict mapping path name to CompiledPath
+        """
+        compiled = cls._compiled_paths.get(namespace)
+        if compiled is None:
+            compiled = {
+                name: CompiledPath('/'.join(f'{namespace}{tag}' for tag in tags))
+                for name, tags in cls._PATHS.items()
+            }
+            cls._compiled_paths[namespace] = compiled
+        return compiled
     
     
-    def parse_document(self, root: ET.Element) -> BankToCustomerStatement:
+    def parse_document(self, root: ET.Element, parallel: bool = False,
+                       detail_level: DetailLevel = 'full') -> BankToCustomerStatement:
         """
         Main orchestrator - parses entire CAMT.053 document
         
+        In-memory fast path for documents already loaded as a tree; use
+        parse_document_stream for large files.
+        
         Args:
             root: Root XML element
+            parallel: Parse statements in a process pool when there are several
+            detail_level: 'summary' skips entries when TxsSummry is present,
+                'entries' skips transaction details, 'lazy' parses transaction
+                details on first access, 'full' parses everything
             
         Returns:
             BankToCustomerStatement object
         """
-        stmt_root = root.find(f'{self.namespace}BkToCstmrStmt')
+        if detail_level not in _DETAIL_LEVELS:
+            raise ValueError(f"Unsupported detail level: {detail_level}")
+        
+        stmt_root = root.find(self._t_bktocstmrstmt)
         if stmt_root is None:
             raise ValueError("BkToCstmrStmt element not found")
         
-        group_header = self._parse_group_header(stmt_root)
-        statements = self._parse_statements(stmt_root)
+        # Single handler for the whole document; per-element loops stay try-free
+        try:
+            group_header = self._parse_group_header(stmt_root)
+            statements = self._parse_statements(stmt_root, parallel=parallel, detail_level=detail_level)
+        except Exception as e:
+            self.logger.error(f"Error parsing document: {str(e)}")
+            raise
+        
+        return BankToCustomerStatement(
+            group_header=group_header,
+            statements=statements
+        )
+    
+    def parse_document_stream(self, source, detail_level: DetailLevel = 'full') -> BankToCustomerStatement:
+        """
+        Parses a CAMT.053 document incrementally with iterparse
+        
+        Large-file path: each Ntry is parsed as soon as it is complete and then
+        discarded, as is each finished Stmt, so peak memory stays around one
+        statement header plus one entry instead of the whole document. Only end
+        events are handled; with lxml they are also filtered to the GrpHdr,
+        Stmt and Ntry tags, and discarded elements are removed from their
+        parent. ElementTree has no parent links, so there they are only cleared.
+        
+        Args:
+            source: File path or binary file object
+            detail_level: As for parse_document, except that 'lazy' parses
+                details up front - entry elements do not outlive the stream
+            
+        Returns:
+            BankToCustomerStatement object
+        """
+        if detail_level not in _DETAIL_LEVELS:
+            raise ValueError(f"Unsupported detail level: {detail_level}")
+        if detail_level == 'lazy':
+            detail_level = 'full'
+        full_details = detail_level == 'full'
+        
+        bk_tag = self._t_bktocstmrstmt
+        grp_hdr_tag = self._t_grphdr
+        stmt_tag = self._t_stmt
+        ntry_tag = self._t_ntry
+        parse_entry = self._parse_entry
+        
+        if _HAS_LXML:
+            context = ET.iterparse(source, events=('end',), tag=(grp_hdr_tag, stmt_tag, ntry_tag))
+        else:
+            context = ET.iterparse(source, events=('end',))
+        
+        group_header = None
+        statements = []
+        entries = []
+        
+        for _, elem in context:
+            tag = elem.tag
+            if tag == ntry_tag:
+                entries.append(parse_entry(elem, len(entries) + 1, full_details))
+                _discard(elem)
+            elif tag == stmt_tag:
+                # ElementTree cannot see the parent; the BkToCstmrStmt check below covers it
+                if _HAS_LXML and getattr(elem.getparent(), 'tag', None) != bk_tag:
+                    raise ValueError("BkToCstmrStmt element not found")
+                statements.append(self._parse_statement(elem, entries=entries, detail_level=detail_level))
+                entries = []
+                _discard(elem)
+            elif tag == grp_hdr_tag:
+                group_header = self._parse_group_header_element(elem)
+        
+        if context.root is None or context.root.find(bk_tag) is None:
+            raise ValueError("BkToCstmrStmt element not found")
+        if group_header is None:
+            raise ValueError("Group Header not found")
+        if not statements:
+            raise ValueError("No statements found in document")
         
         return BankToCustomerStatement(
             group_header=group_header,
@@ -58,13 +290,25 @@ class DocumentParser:
         Returns:
             GroupHeader object
         """
-        grp_hdr = root.find(f'{self.namespace}GrpHdr')
+        grp_hdr = root.find(self._t_grphdr)
         if grp_hdr is None:
             raise ValueError("Group Header not found")
         
-        msg_id = get_text(grp_hdr, f'{self.namespace}MsgId', required=True)
-        cre_dt = get_text(grp_hdr, f'{self.namespace}CreDtTm', required=True)
-        add_inf = get_text(grp_hdr, f'{self.namespace}AddtlInf', required=False)
+        return self._parse_group_header_element(grp_hdr)
+    
+    def _parse_group_header_element(self, grp_hdr: ET.Element) -> GroupHeader:
+        """
+        Parses a GrpHdr element already located by the caller
+        
+        Args:
+            grp_hdr: GrpHdr XML element
+            
+        Returns:
+            GroupHeader object
+        """
+        msg_id = get_text(grp_hdr, self._t_msgid, required=True)
+        cre_dt = get_text(grp_hdr, self._t_credttm, required=True)
+        add_inf = get_text(grp_hdr, self._t_addtlinf, required=False)
         
         return GroupHeader(
             message_id=msg_id,
@@ -72,55 +316,106 @@ class DocumentParser:
             additional_info=add_inf
         )
     
-    def _parse_statements(self, root: ET.Element) -> List[Statement]:
+    def _parse_statements(self, root: ET.Element, parallel: bool = False,
+                          detail_level: DetailLevel = 'full') -> List[Statement]:
         """
         Parses all statement elements (Stmt)
         
         Args:
             root: BkToCstmrStmt element
+            parallel: Parse statements in a process pool when there are several
+            detail_level: How much of each statement to parse
             
         Returns:
             List of Statement objects
         """
         statements = []
-        stmt_elements = root.findall(f'{self.namespace}Stmt')
+        stmt_elements = iter_children(root, self._t_stmt)
         
-        if not stmt_elements:
-            raise ValueError("No statements found in document")
+        if parallel:
+            # The pool needs the full list up front to serialize each Stmt
+            stmt_elements = list(stmt_elements)
+            if len(stmt_elements) > 1:
+                return self._parse_statements_parallel(stmt_elements, detail_level)
         
         for stmt_elem in stmt_elements:
-            try:
-                statement = self._parse_statement(stmt_elem)
-                statements.append(statement)
-            except Exception as e:
-                self.logger.error(f"Error parsing statement: {str(e)}")
-                raise
+            statements.append(self._parse_statement(stmt_elem, detail_level=detail_level))
+        
+        if not statements:
+            raise ValueError("No statements found in document")
         
         return statements
     
   
     
-    def _parse_statement(self, stmt: ET.Element) -> Statement:
+    def _parse_statements_parallel(self, stmt_elements: List[ET.Element],
+                                   detail_level: DetailLevel = 'full') -> List[Statement]:
+        """
+        Parses independent statements across worker processes
+        
+        Each Stmt is serialized once here and re-parsed by a worker that holds
+        its own DocumentParser for this namespace.
+        
+        Args:
+            stmt_elements: Stmt XML elements
+            detail_level: How much of each statement to parse
+            
+        Returns:
+            List of Statement objects in document order
+        """
+        blobs = [element_to_bytes(stmt_elem) for stmt_elem in stmt_elements]
+        
+        with ProcessPoolExecutor(
+            initializer=_init_statement_worker, initargs=(self.namespace,)
+        ) as executor:
+            try:
+                return list(executor.map(
+                    _parse_statement_bytes, blobs, [detail_level] * len(blobs)
+                ))
+            except Exception as e:
+                self.logger.error(f"Error parsing statement: {str(e)}")
+                raise
+    
+    def _parse_statement(self, stmt: ET.Element, entries: Optional[List[Entry]] = None,
+                         detail_level: DetailLevel = 'full') -> Statement:
         """
         Parses one complete statement
         
         Args:
             stmt: Stmt XML element
+            entries: Entries already parsed by the streaming path (parsed from stmt if None)
+            detail_level: How much of the statement to parse
             
         Returns:
             Statement object
         """
+        # One sweep over the statement's children; Bal and Ntry repeat, the rest are single
+        header = {}
+        bal_elements = []
+        entry_elements = []
+        t_bal = self._t_bal
+        t_ntry = self._t_ntry
+        header_tags = self._stmt_header_tags
+        for child in stmt:
+            tag = child.tag
+            if tag == t_ntry:
+                entry_elements.append(child)
+            elif tag == t_bal:
+                bal_elements.append(child)
+            elif tag in header_tags and tag not in header:
+                header[tag] = child
+        
         # Basic info
-        stmt_id = get_text(stmt, f'{self.namespace}Id', required=True)
-        elec_seq = get_text(stmt, f'{self.namespace}ElctrncSeqNb', required=True)
-        cre_dt = get_text(stmt, f'{self.namespace}CreDtTm', required=True)
+        stmt_id = child_text(header, self._t_id, required=True)
+        elec_seq = child_text(header, self._t_elctrncseqnb, required=True)
+        cre_dt = child_text(header, self._t_credttm, required=True)
         creation_datetime = parse_datetime(cre_dt)
         
         # Date range - FrToDt is optional
-        fr_to_dt = stmt.find(f'{self.namespace}FrToDt')
+        fr_to_dt = header.get(self._t_frtodt)
         if fr_to_dt is not None:
-            from_dt = get_text(fr_to_dt, f'{self.namespace}FrDtTm', required=True)
-            to_dt = get_text(fr_to_dt, f'{self.namespace}ToDtTm', required=True)
+            from_dt = get_text(fr_to_dt, self._t_frdttm, required=True)
+            to_dt = get_text(fr_to_dt, self._t_todttm, required=True)
             from_datetime = parse_datetime(from_dt)
             to_datetime = parse_datetime(to_dt)
         else:
@@ -129,20 +424,28 @@ class DocumentParser:
             to_datetime = creation_datetime
         
         # Account
-        account = self._parse_account(stmt)
+        account = self._parse_account(header.get(self._t_acct))
         
         # Balances
-        balances = self._parse_balances(stmt)
+        balances = self._parse_balances(bal_elements)
         
         # Transaction summary - may or may not exist
-        tx_summary_elem = stmt.find(f'{self.namespace}TxsSummry')
+        tx_summary_elem = header.get(self._t_txssummry)
+        full_details = detail_level in ('lazy', 'full')
+        lazy = detail_level == 'lazy'
         if tx_summary_elem is not None:
             tx_summary = self._parse_transaction_summary(tx_summary_elem)
-            entries = self._parse_entries(stmt)
+            if detail_level == 'summary':
+                entries = []
+            elif entries is None:
+                entries = self._parse_entries(entry_elements, full_details, lazy)
         else:
             # Calculate from entries
-            entries = self._parse_entries(stmt)
+            if entries is None:
+                entries = self._parse_entries(entry_elements, full_details, lazy)
             tx_summary = self._calculate_transaction_summary(entries, balances)
+            if detail_level == 'summary':
+                entries = []
         
         return Statement(
             id=stmt_id,
@@ -156,39 +459,38 @@ class DocumentParser:
             entries=entries
         )
     
-    def _parse_account(self, stmt: ET.Element) -> Account:
+    def _parse_account(self, acct: Optional[ET.Element]) -> Account:
         """
         Parses account information (Acct element)
         
         Args:
-            stmt: Stmt XML element
+            acct: Acct XML element from the statement sweep
             
         Returns:
             Account object
         """
-        acct = stmt.find(f'{self.namespace}Acct')
         if acct is None:
             raise ValueError("Account element not found")
         
         # Account ID
         acct_id = get_text(
-            acct, f'{self.namespace}Id/{self.namespace}Othr/{self.namespace}Id',
+            acct, self._xp_acct_id,
             required=True
         )
         
         # Currency
-        ccy = get_text(acct, f'{self.namespace}Ccy', required=True)
+        ccy = get_text(acct, self._t_ccy, required=True)
         
         # Servicer/BIC - Try both BICFI (v12) and BIC (v02)
         bic = get_text(
             acct,
-            f'{self.namespace}Svcr/{self.namespace}FinInstnId/{self.namespace}BICFI',
+            self._xp_acct_bicfi,
             required=False
         )
         if not bic:
             bic = get_text(
                 acct,
-                f'{self.namespace}Svcr/{self.namespace}FinInstnId/{self.namespace}BIC',
+                self._xp_acct_bic,
                 required=False
             )
         
@@ -203,53 +505,42 @@ class DocumentParser:
             servicer=FinancialInstitution(bic=bic)
         )
     
-    def _parse_balances(self, stmt: ET.Element) -> List[Balance]:
+    def _parse_balances(self, bal_elements: Iterable[ET.Element]) -> List[Balance]:
         """
         Parses all balance elements (Bal)
         
         Args:
-            stmt: Stmt XML element
+            bal_elements: Bal XML elements from the statement sweep
             
         Returns:
             List of Balance objects
         """
-        from datetime import date
-        
         balances = []
-        bal_elements = stmt.findall(f'{self.namespace}Bal')
-        
         for bal_elem in bal_elements:
-            bal_type_code = get_text(
-                bal_elem,
-                f'{self.namespace}Tp/{self.namespace}CdOrPrtry/{self.namespace}Cd',
-                required=True
+            children = collect_children(bal_elem, self._bal_tags)
+            bal_type_code = child_text(
+                children, self._t_tp,
+                required=True,
+                sub_tag=self._p_bal_type_cd
             )
             
-            bal_type_map = {
-                'OPBD': BalanceType.OPENING,
-                'CLBD': BalanceType.CLOSING,
-                'CLAV': BalanceType.AVAILABLE
-            }
-            bal_type = bal_type_map.get(bal_type_code)
+            bal_type = _BAL_TYPE_MAP.get(bal_type_code)
             if bal_type is None:
                 self.logger.warning(f"Unknown balance type: {bal_type_code}")
                 continue
             
             # Amount
-            amt_elem = bal_elem.find(f'{self.namespace}Amt')
+            amt_elem = children.get(self._t_amt)
             if amt_elem is None or not amt_elem.text:
                 raise ValueError(f"Balance amount not found for type {bal_type_code}")
-            amount = Decimal(amt_elem.text)
+            amount = _dec(amt_elem.text)
             
             # Credit/Debit indicator
-            cdt_dbt = get_text(bal_elem, f'{self.namespace}CdtDbtInd', required=True)
-            cdt_dbt_ind = CreditDebitIndicator.CREDIT if cdt_dbt == 'CRDT' else CreditDebitIndicator.DEBIT
+            cdt_dbt = child_text(children, self._t_cdtdbtind, required=True)
+            cdt_dbt_ind = _CDT_IND(cdt_dbt, CreditDebitIndicator.DEBIT)
             
             # Date
-            bal_date = get_text(
-                bal_elem, f'{self.namespace}Dt/{self.namespace}Dt',
-                required=True
-            )
+            bal_date = child_text(children, self._t_dt, required=True, sub_tag=self._t_dt)
             
             balances.append(Balance(
                 type=bal_type,
@@ -266,7 +557,7 @@ class DocumentParser:
             # Get a reference balance for dummy creation
             ref_balance = balances[0] if balances else None
             
-            for bal_type in [BalanceType.OPENING, BalanceType.CLOSING, BalanceType.AVAILABLE]:
+            for bal_type in _BAL_TYPES_ALL:
                 if bal_type not in existing_types:
                     balances.append(Balance(
                         type=bal_type,
@@ -287,37 +578,42 @@ class DocumentParser:
         Returns:
             TransactionSummary object
         """
+        buckets = collect_children(summary, self._summary_tags)
+        
         # Total entries
-        ttl_ntries = summary.find(f'{self.namespace}TtlNtries')
+        ttl_ntries = buckets.get(self._t_ttlntries)
         if ttl_ntries is None:
             raise ValueError("Total Entries not found")
         
-        total_count = int(get_text(ttl_ntries, f'{self.namespace}NbOfNtries', required=True))
-        total_sum = Decimal(get_text(ttl_ntries, f'{self.namespace}Sum', required=True))
-        total_net = Decimal(get_text(ttl_ntries, f'{self.namespace}TtlNetNtryAmt', required=True))
-        net_ind = get_text(ttl_ntries, f'{self.namespace}CdtDbtInd', required=True)
+        totals = collect_children(ttl_ntries, self._summary_total_tags)
+        total_count = int(child_text(totals, self._t_nbofntries, required=True))
+        total_sum = _dec(child_text(totals, self._t_sum, required=True))
+        total_net = _dec(child_text(totals, self._t_ttlnetntryamt, required=True))
+        net_ind = child_text(totals, self._t_cdtdbtind, required=True)
         
         # Credit entries
-        cdt_ntries = summary.find(f'{self.namespace}TtlCdtNtries')
+        cdt_ntries = buckets.get(self._t_ttlcdtntries)
         if cdt_ntries is None:
             raise ValueError("Total Credit Entries not found")
         
-        cdt_count = int(get_text(cdt_ntries, f'{self.namespace}NbOfNtries', required=True))
-        cdt_sum = Decimal(get_text(cdt_ntries, f'{self.namespace}Sum', required=True))
+        cdt_totals = collect_children(cdt_ntries, self._summary_total_tags)
+        cdt_count = int(child_text(cdt_totals, self._t_nbofntries, required=True))
+        cdt_sum = _dec(child_text(cdt_totals, self._t_sum, required=True))
         
         # Debit entries
-        dbt_ntries = summary.find(f'{self.namespace}TtlDbtNtries')
+        dbt_ntries = buckets.get(self._t_ttldbtntries)
         if dbt_ntries is None:
             raise ValueError("Total Debit Entries not found")
         
-        dbt_count = int(get_text(dbt_ntries, f'{self.namespace}NbOfNtries', required=True))
-        dbt_sum = Decimal(get_text(dbt_ntries, f'{self.namespace}Sum', required=True))
+        dbt_totals = collect_children(dbt_ntries, self._summary_total_tags)
+        dbt_count = int(child_text(dbt_totals, self._t_nbofntries, required=True))
+        dbt_sum = _dec(child_text(dbt_totals, self._t_sum, required=True))
         
         return TransactionSummary(
             total_entries_count=total_count,
             total_entries_sum=total_sum,
             total_net_amount=total_net,
-            net_credit_debit_indicator=CreditDebitIndicator.CREDIT if net_ind == 'CRDT' else CreditDebitIndicator.DEBIT,
+            net_credit_debit_indicator=_CDT_IND(net_ind, CreditDebitIndicator.DEBIT),
             total_credit_entries_count=cdt_count,
             total_credit_entries_sum=cdt_sum,
             total_debit_entries_count=dbt_count,
@@ -335,18 +631,16 @@ class DocumentParser:
         Returns:
             Computed TransactionSummary object
         """
-        total_credit = Decimal('0')
-        total_debit = Decimal('0')
-        credit_count = 0
-        debit_count = 0
-        
+        # One identity check per entry; enum members are singletons
+        credit_amounts = []
+        debit_amounts = []
         for entry in entries:
-            if entry.credit_debit_indicator == CreditDebitIndicator.CREDIT:
-                total_credit += entry.amount
-                credit_count += 1
-            else:
-                total_debit += entry.amount
-                debit_count += 1
+            (credit_amounts if entry.credit_debit_indicator is _CREDIT else debit_amounts).append(entry.amount)
+        
+        total_credit = sum(credit_amounts, Decimal('0'))
+        total_debit = sum(debit_amounts, Decimal('0'))
+        credit_count = len(credit_amounts)
+        debit_count = len(debit_amounts)
         
         total_count = credit_count + debit_count
         total_sum = total_credit + total_debit
@@ -365,77 +659,82 @@ class DocumentParser:
         )
     
   
-    def _parse_entries(self, stmt: ET.Element) -> List[Entry]:
+    def _parse_entries(self, entry_elements: Iterable[ET.Element], full_details: bool = True,
+                       lazy: bool = False) -> List[Entry]:
         """
         Parses all transaction entries (Ntry elements)
         
         Args:
-            stmt: Stmt XML element
+            entry_elements: Ntry XML elements from the statement sweep
+            full_details: Parse NtryDtls/TxDtls (otherwise a minimal detail per entry)
+            lazy: Defer NtryDtls/TxDtls parsing until Entry.load_details() is called
             
         Returns:
             List of Entry objects
         """
         entries = []
-        entry_elements = stmt.findall(f'{self.namespace}Ntry')
-        
+        # Bound once; these run for every entry
+        parse_entry = self._parse_entry
+        append = entries.append
         for idx, entry_elem in enumerate(entry_elements, 1):
-            try:
-                entry = self._parse_entry(entry_elem, idx)
-                entries.append(entry)
-            except Exception as e:
-                self.logger.error(f"Error parsing entry {idx}: {str(e)}")
-                raise
+            append(parse_entry(entry_elem, idx, full_details, lazy))
         
         return entries
     
-    def _parse_entry(self, entry: ET.Element, entry_num: int) -> Entry:
+    def _parse_entry(self, entry: ET.Element, entry_num: int, full_details: bool = True,
+                     lazy: bool = False) -> Entry:
         """
         Parses one transaction entry
         
         Args:
             entry: Ntry XML element
             entry_num: Entry number for default reference generation
+            full_details: Parse NtryDtls/TxDtls (otherwise a minimal detail)
+            lazy: Defer NtryDtls/TxDtls parsing until Entry.load_details() is called
             
         Returns:
             Entry object
         """
+        children = collect_children(entry, self._entry_tags)
+        
         # Entry reference - may not exist
-        ntry_ref = get_text(entry, f'{self.namespace}NtryRef', required=False)
+        ntry_ref = child_text(children, self._t_ntryref, required=False)
         if not ntry_ref:
             ntry_ref = f"ENTRY-{entry_num}"
         
         # Amount
-        amt_elem = entry.find(f'{self.namespace}Amt')
+        amt_elem = children.get(self._t_amt)
         if amt_elem is None or not amt_elem.text:
             raise ValueError("Entry amount not found")
-        amount = Decimal(amt_elem.text)
+        amount = _dec(amt_elem.text)
         
         # Credit/Debit indicator
-        cdt_dbt = get_text(entry, f'{self.namespace}CdtDbtInd', required=True)
-        cdt_dbt_ind = CreditDebitIndicator.CREDIT if cdt_dbt == 'CRDT' else CreditDebitIndicator.DEBIT
+        cdt_dbt = child_text(children, self._t_cdtdbtind, required=True)
+        cdt_dbt_ind = _CDT_IND(cdt_dbt, CreditDebitIndicator.DEBIT)
         
         # Status - may not exist
-        status = get_text(entry, f'{self.namespace}Sts', required=False)
+        status = child_text(children, self._t_sts, required=False)
         if not status:
             status = "BOOK"  # Default to booked
         
         # Dates
-        booking_date = get_text(
-            entry, f'{self.namespace}BookgDt/{self.namespace}Dt',
-            required=True
-        )
-        value_date = get_text(
-            entry, f'{self.namespace}ValDt/{self.namespace}Dt',
-            required=True
-        )
+        booking_date = child_text(children, self._t_bookgdt, required=True, sub_tag=self._t_dt)
+        value_date = child_text(children, self._t_valdt, required=True, sub_tag=self._t_dt)
         
         # Bank transaction code
-        bk_tx_cd = self._parse_bank_transaction_code(
-            entry.find(f'{self.namespace}BkTxCd')
-        )
-        
-        # Transaction details
-        tx_details = self._parse_transaction_details(entry)
+        bk_tx_cd = self._parse_bank_transaction_code(children.get(self._t_bktxcd))
+        
+        # Transaction details - Entry requires at least one, so the light
+        # path keeps the minimal detail instead of walking NtryDtls
+        details_loader = None
+        if lazy and full_details:
+            # Keeps a reference to the Ntry element until the details are read
+            tx_details = []
+            details_loader = partial(self._parse_transaction_details, entry, amount, bk_tx_cd)
+        elif full_details:
+            tx_details = self._parse_transaction_details(entry, amount, bk_tx_cd)
+        else:
+            tx_details = [self._create_minimal_transaction_detail(amount, bk_tx_cd)]
         
         return Entry(
             entry_reference=ntry_ref,
@@ -445,7 +744,8 @@ class DocumentParser:
             booking_date=parse_date(booking_date),
             value_date=parse_date(value_date),
             bank_transaction_code=bk_tx_cd,
-            transaction_details=tx_details
+            transaction_details=tx_details,
+            details_loader=details_loader
         )
     
     def _parse_bank_transaction_code(self, bk_tx_cd: Optional[ET.Element]) -> BankTransactionCode:
@@ -461,104 +761,110 @@ class DocumentParser:
         if bk_tx_cd is None:
             raise ValueError("Bank Transaction Code not found")
         
+        gt = get_text  # bound once; called up to five times per entry
+        
         # Try full structure first (v02 format with Domain/Family)
-        domn = bk_tx_cd.find(f'{self.namespace}Domn')
+        domn = bk_tx_cd.find(self._t_domn)
         if domn is not None:
             # Full structure exists
-            domain_code = get_text(domn, f'{self.namespace}Cd', required=True)
+            domain_code = gt(domn, self._t_cd, required=True)
             
-            fmly = domn.find(f'{self.namespace}Fmly')
+            fmly = domn.find(self._t_fmly)
             if fmly is None:
                 raise ValueError("Family not found in BkTxCd")
             
-            family_code = get_text(fmly, f'{self.namespace}Cd', required=True)
-            sub_family_code = get_text(fmly, f'{self.namespace}SubFmlyCd', required=True)
+            family_code = gt(fmly, self._t_cd, required=True)
+            sub_family_code = gt(fmly, self._t_subfmlycd, required=True)
             
             # Proprietary
-            prtry = bk_tx_cd.find(f'{self.namespace}Prtry')
+            prtry = bk_tx_cd.find(self._t_prtry)
             if prtry is not None:
-                prop_code = get_text(prtry, f'{self.namespace}Cd', required=True)
-                issuer = get_text(prtry, f'{self.namespace}Issr', required=True)
+                prop_code = gt(prtry, self._t_cd, required=True)
+                issuer = gt(prtry, self._t_issr, required=True)
             else:
                 prop_code = f"{domain_code}-{family_code}-{sub_family_code}"
                 issuer = "BANK"
             
-            return BankTransactionCode(
-                domain_code=domain_code,
-                family_code=family_code,
-                sub_family_code=sub_family_code,
-                proprietary_code=prop_code,
-                issuer=issuer
-            )
+            key = (domain_code, family_code, sub_family_code, prop_code, issuer)
+            bk_tx_code = self._bktxcd_cache.get(key)
+            if bk_tx_code is None:
+                bk_tx_code = BankTransactionCode(
+                    domain_code=domain_code,
+                    family_code=family_code,
+                    sub_family_code=sub_family_code,
+                    proprietary_code=prop_code,
+                    issuer=issuer
+                )
+                self._bktxcd_cache[key] = bk_tx_code
+            return bk_tx_code
         else:
             # Simplified structure - only Prtry field (v12 format)
-            prop_code = get_text(bk_tx_cd, f'{self.namespace}Prtry', required=True)
+            prop_code = gt(bk_tx_cd, self._t_prtry, required=True)
+            
+            bk_tx_code = self._bktxcd_cache.get(prop_code)
+            if bk_tx_code is not None:
+                return bk_tx_code
             
             # Parse the proprietary code (e.g., "PMNT-CRDT" or "CARD-PURCH")
             parts = prop_code.split('-')
             domain_code = parts[0] if len(parts) > 0 else prop_code
             family_code = parts[1] if len(parts) > 1 else "UNKNOWN"
             
-            return BankTransactionCode(
+            bk_tx_code = BankTransactionCode(
                 domain_code=domain_code,
                 family_code=family_code,
                 sub_family_code="UNKNOWN",
                 proprietary_code=prop_code,
                 issuer="BANK"
             )
+            self._bktxcd_cache[prop_code] = bk_tx_code
+            return bk_tx_code
     
 
     
-    def _parse_transaction_details(self, entry: ET.Element) -> List[TransactionDetails]:
+    def _parse_transaction_details(self, entry: ET.Element, amount: Decimal,
+                                   bk_tx_cd: BankTransactionCode) -> List[TransactionDetails]:
         """
         Parses entry details (NtryDtls element)
         
         Args:
             entry: Ntry XML element
+            amount: Entry amount already parsed for the entry
+            bk_tx_cd: Bank transaction code already parsed for the entry
             
         Returns:
             List of TransactionDetails objects
         """
         details = []
-        ntry_dtls = entry.find(f'{self.namespace}NtryDtls')
+        ntry_dtls = entry.find(self._t_ntrydtls)
         
         if ntry_dtls is None:
             self.logger.warning("Entry Details not found, creating minimal detail")
-            return [self._create_minimal_transaction_detail(entry)]
+            return [self._create_minimal_transaction_detail(amount, bk_tx_cd)]
         
-        tx_dtls_elements = ntry_dtls.findall(f'{self.namespace}TxDtls')
+        parse_detail = self._parse_single_transaction_detail
+        append = details.append
+        for tx_dtls in iter_children(ntry_dtls, self._t_txdtls):
+            append(parse_detail(tx_dtls, amount, bk_tx_cd))
         
-        if not tx_dtls_elements:
+        if not details:
             self.logger.warning("No Transaction Details found, creating minimal detail")
-            return [self._create_minimal_transaction_detail(entry)]
-        
-        for tx_dtls in tx_dtls_elements:
-            try:
-                detail = self._parse_single_transaction_detail(tx_dtls, entry)
-                details.append(detail)
-            except Exception as e:
-                self.logger.error(f"Error parsing transaction detail: {str(e)}")
-                raise
+            return [self._create_minimal_transaction_detail(amount, bk_tx_cd)]
         
         return details
     
-    def _create_minimal_transaction_detail(self, entry: ET.Element) -> TransactionDetails:
+    def _create_minimal_transaction_detail(self, amount: Decimal,
+                                           bk_tx_cd: BankTransactionCode) -> TransactionDetails:
         """
         Create minimal transaction detail when full details not available
         
         Args:
-            entry: Ntry XML element
+            amount: Entry amount already parsed for the entry
+            bk_tx_cd: Bank transaction code already parsed for the entry
             
         Returns:
             Minimal TransactionDetails object
         """
-        from camt_core.models import TransactionReferences
-        
-        amt_elem = entry.find(f'{self.namespace}Amt')
-        amount = Decimal(amt_elem.text) if amt_elem is not None and amt_elem.text else Decimal('0')
-        
-        bk_tx_cd = self._parse_bank_transaction_code(entry.find(f'{self.namespace}BkTxCd'))
-        
         return TransactionDetails(
             references=TransactionReferences(),
             amount=amount,
@@ -571,75 +877,74 @@ class DocumentParser:
             transaction_datetime=None
         )
     
-    def _parse_single_transaction_detail(self, tx_dtls: ET.Element, entry: ET.Element) -> TransactionDetails:
+    def _parse_single_transaction_detail(self, tx_dtls: ET.Element, amount: Decimal,
+                                         bk_tx_cd: BankTransactionCode) -> TransactionDetails:
         """
         Parses one complete transaction detail (TxDtls element) with account information
         
         Args:
             tx_dtls: TxDtls XML element
-            entry: Parent Ntry element (for fallback data)
+            amount: Entry amount (used since AmtDtls may not exist)
+            bk_tx_cd: Bank transaction code already parsed for the entry
             
         Returns:
             TransactionDetails object
         """
         # References
-        refs = self.helper_parsers.parse_references(tx_dtls.find(f'{self.namespace}Refs'))
-        
-        # Amount - use entry amount since AmtDtls may not exist
-        amt_elem = entry.find(f'{self.namespace}Amt')
-        amount = Decimal(amt_elem.text) if amt_elem is not None and amt_elem.text else Decimal('0')
-        
-        # Bank transaction code - from entry level
-        bk_tx_cd = self._parse_bank_transaction_code(entry.find(f'{self.namespace}BkTxCd'))
+        refs = self.helper_parsers.parse_references(tx_dtls.find(self._t_refs))
         
         # Related parties with account details
-        rltd_parties = tx_dtls.find(f'{self.namespace}RltdPties')
+        rltd_parties = tx_dtls.find(self._t_rltdpties)
         creditor = None
         debtor = None
         
         if rltd_parties is not None:
             # Parse creditor with account and agent
             creditor = self.helper_parsers.parse_related_party(
-                party=rltd_parties.find(f'{self.namespace}Cdtr'),
-                party_account=rltd_parties.find(f'{self.namespace}CdtrAcct'),
-                party_agent=rltd_parties.find(f'{self.namespace}CdtrAgt')
+                party=rltd_parties.find(self._t_cdtr),
+                party_account=rltd_parties.find(self._t_cdtracct),
+                party_agent=rltd_parties.find(self._t_cdtragt)
             )
             
             # Parse debtor with account and agent
             debtor = self.helper_parsers.parse_related_party(
-                party=rltd_parties.find(f'{self.namespace}Dbtr'),
-                party_account=rltd_parties.find(f'{self.namespace}DbtrAcct'),
-                party_agent=rltd_parties.find(f'{self.namespace}DbtrAgt')
+                party=rltd_parties.find(self._t_dbtr),
+                party_account=rltd_parties.find(self._t_dbtracct),
+                party_agent=rltd_parties.find(self._t_dbtragt)
             )
         
         # Related agents (if not in RltdPties)
-        rltd_agts = tx_dtls.find(f'{self.namespace}RltdAgts')
+        rltd_agts = tx_dtls.find(self._t_rltdagts)
         if rltd_agts is not None and creditor:
             # Update creditor agent BIC if not already set
             if not creditor.agent_bic:
                 creditor.agent_bic = self.helper_parsers._parse_agent_bic(
-                    rltd_agts.find(f'{self.namespace}CdtrAgt')
+                    rltd_agts.find(self._t_cdtragt)
                 )
         
         if rltd_agts is not None and debtor:
             # Update debtor agent BIC if not already set
             if not debtor.agent_bic:
                 debtor.agent_bic = self.helper_parsers._parse_agent_bic(
-                    rltd_agts.find(f'{self.namespace}DbtrAgt')
+                    rltd_agts.find(self._t_dbtragt)
                 )
         
         # Remittance information
         rmt_inf = self.helper_parsers.parse_remittance_info(
-            tx_dtls.find(f'{self.namespace}RmtInf')
+            tx_dtls.find(self._t_rmtinf)
         )
         
         # Return information
         rtr_inf = self.helper_parsers.parse_return_info(
-            tx_dtls.find(f'{self.namespace}RtrInf')
+            tx_dtls.find(self._t_rtrinf)
         )
         
         # Additional info
-        add_tx_inf = get_text(tx_dtls, f'{self.namespace}AddtlTxInf')
+        add_tx_inf_elem = tx_dtls.find(self._t_addtltxinf)
+        add_tx_inf = (
+            add_tx_inf_elem.text.strip()
+            if add_tx_inf_elem is not None and add_tx_inf_elem.text else None
+        )
         
         return TransactionDetails(
             references=refs,
@@ -651,4 +956,31 @@ class DocumentParser:
             return_info=rtr_inf,
             additional_info=add_tx_inf,
             transaction_datetime=None
-        )
\ No newline at end of file
+        )
+
+
+def _discard(elem: ET.Element) -> None:
+    """Frees a parsed element during iterparse, detaching it from its parent where possible"""
+    elem.clear()
+    if _HAS_LXML:
+        parent = elem.getparent()
+        if parent is not None:
+            parent.remove(elem)
+
+
+# Per-process parser used by _parse_statements_parallel workers
+_worker_parser: Optional[DocumentParser] = None
+
+
+def _init_statement_worker(namespace: str) -> None:
+    """Builds the worker's DocumentParser once so its tag/path tables are reused"""
+    global _worker_parser
+    _worker_parser = DocumentParser(namespace, logging.getLogger(__name__))
+
+
+def _parse_statement_bytes(blob: bytes, detail_level: DetailLevel = 'full') -> Statement:
+    """Parses one serialized Stmt element in a worker process"""
+    if detail_level == 'lazy':
+        # Loaders hold XML elements, which cannot be sent back to the parent
+        detail_level = 'full'
+    return _worker_parser._parse_statement(ET.fromstring(blob), detail_level=detail_level)
@@ -2,23 +2,93 @@
 Helper Parsers - Updated to extract account details
 Specialized parsers for specific data structures like references, parties, remittance info
 """
-import xml.etree.ElementTree as ET
 import logging
+import sys
+
+try:
+    from lxml import etree as ET
+except ImportError:  # lxml not available - stdlib ElementTree offers the same find API
+    import xml.etree.ElementTree as ET
 from typing import Optional, List
 
 from CAMT.src.camt_core.models.camt_model import (
     TransactionReferences, RelatedParty, PartyAccount, 
     RemittanceInformation, ReturnInformation
 )
-from CAMT.src.camt_core.utils.parser_utils import get_text
+from CAMT.src.camt_core.utils.parser_utils import CompiledChoice, CompiledPath, extract_bsb, get_text
 
 
 class HelperParsers:
     """Collection of helper parsing methods for specific data structures"""
     
+    # Child paths read by the helpers, compiled once per namespace (see _get_compiled_paths)
+    _PATHS = {
+        'instr_id': ('InstrId',),
+        'end_to_end_id': ('EndToEndId',),
+        'tx_id': ('TxId',),
+        'pmt_inf_id': ('PmtInfId',),
+        'msg_id': ('MsgId',),
+        'acct_svcr_ref': ('AcctSvcrRef',),
+        'nm': ('Nm',),
+        'ctct_dtls': ('CtctDtls',),
+        'email': ('EmailAdr',),
+        'othr': ('Othr',),
+        'ustrd': ('Ustrd',),
+        'rsn_cd': ('Rsn', 'Cd'),
+        'addtl_inf': ('AddtlInf',),
+    }
+    
+    # Schema choices resolved with one lookup: IBAN or Othr/Id, BICFI (v12) or BIC (v02)
+    _CHOICES = {
+        'acct_id': (('Id', 'IBAN'), ('Id', 'Othr', 'Id')),
+        'agent_bic': (('FinInstnId', 'BICFI'), ('FinInstnId', 'BIC')),
+    }
+    
+    # namespace -> {name: CompiledPath | CompiledChoice}, shared by all helpers of the same namespace
+    _compiled_paths = {}
+    
     def __init__(self, namespace: str, logger: logging.Logger):
         self.namespace = namespace
         self.logger = logger
+        
+        paths = self._get_compiled_paths(namespace)
+        self._p_instr_id = paths['instr_id']
+        self._p_end_to_end_id = paths['end_to_end_id']
+        self._p_tx_id = paths['tx_id']
+        self._p_pmt_inf_id = paths['pmt_inf_id']
+        self._p_msg_id = paths['msg_id']
+        self._p_acct_svcr_ref = paths['acct_svcr_ref']
+        self._p_nm = paths['nm']
+        self._p_ctct_dtls = paths['ctct_dtls']
+        self._p_email = paths['email']
+        self._p_othr = paths['othr']
+        self._p_ustrd = paths['ustrd']
+        self._p_rsn_cd = paths['rsn_cd']
+        self._p_addtl_inf = paths['addtl_inf']
+        self._p_acct_id = paths['acct_id']
+        self._p_agent_bic = paths['agent_bic']
+    
+    @classmethod
+    def _get_compiled_paths(cls, namespace: str) -> dict:
+        """
+        Compile the registered paths for a namespace once
+        
+        Args:
+            namespace: Namespace string like '{http://...}'
+            
+        Returns:
+            Dict mapping path name to CompiledPath or CompiledChoice
+        """
+        compiled = cls._compiled_paths.get(namespace)
+        if compiled is None:
+            def qualify(tags):
+                return sys.intern('/'.join(f'{namespace}{tag}' for tag in tags))
+            
+            compiled = {name: CompiledPath(qualify(tags)) for name, tags in cls._PATHS.items()}
+            for name, alternatives in cls._CHOICES.items():
+                compiled[name] = CompiledChoice(*map(qualify, alternatives))
+            cls._compiled_paths[namespace] = compiled
+        return compiled
     
     def parse_references(self, refs: Optional[ET.Element]) -> TransactionReferences:
         """
@@ -33,13 +103,15 @@ class HelperParsers:
         if refs is None:
             return TransactionReferences()
         
+        # Positional in field order: instruction, end-to-end, transaction,
+        # payment info, message, account servicer reference
         return TransactionReferences(
-            instruction_id=get_text(refs, f'{self.namespace}InstrId'),
-            end_to_end_id=get_text(refs, f'{self.namespace}EndToEndId'),
-            transaction_id=get_text(refs, f'{self.namespace}TxId'),
-            payment_info_id=get_text(refs, f'{self.namespace}PmtInfId'),
-            message_id=get_text(refs, f'{self.namespace}MsgId'),
-            account_servicer_ref=get_text(refs, f'{self.namespace}AcctSvcrRef')
+            get_text(refs, self._p_instr_id),
+            get_text(refs, self._p_end_to_end_id),
+            get_text(refs, self._p_tx_id),
+            get_text(refs, self._p_pmt_inf_id),
+            get_text(refs, self._p_msg_id),
+            get_text(refs, self._p_acct_svcr_ref)
         )
     
     def _parse_party_account(self, acct: Optional[ET.Element]) -> Optional[PartyAccount]:
@@ -55,28 +127,16 @@ class HelperParsers:
         if acct is None:
             return None
         
-        # Try to get IBAN
-        iban = get_text(acct, f'{self.namespace}Id/{self.namespace}IBAN')
-        
-        # Try to get Other ID (BSB + Account format)
-        other_id = get_text(acct, f'{self.namespace}Id/{self.namespace}Othr/{self.namespace}Id')
-        
-        account_id = iban or other_id
+        # IBAN or Other ID (BSB + Account format) in one lookup
+        account_id = get_text(acct, self._p_acct_id)
         
         if not account_id:
             return None
         
-        # Extract BSB if present in account_id
-        bsb = None
-        if account_id:
-            if "-" in account_id:
-                # Format: "032-999999994"
-                bsb = account_id.split("-")[0]
-            elif len(account_id) >= 3 and account_id[:3].isdigit():
-                # Format: "032999999994" - extract first 3 digits as BSB
-                bsb = account_id[:3]
-        
-        return PartyAccount(account_id=account_id, bsb=bsb)
+        # Extract BSB: "032-999999994" or first 3 digits of "032999999994"
+        bsb = extract_bsb(account_id, 3)
+        
+        return PartyAccount(account_id, bsb)
     
     def _parse_agent_bic(self, agt: Optional[ET.Element]) -> Optional[str]:
         """
@@ -91,12 +151,10 @@ class HelperParsers:
         if agt is None:
             return None
         
-        # Try BICFI first (v12), then BIC (v02)
-        bic = get_text(agt, f'{self.namespace}FinInstnId/{self.namespace}BICFI')
-        if not bic:
-            bic = get_text(agt, f'{self.namespace}FinInstnId/{self.namespace}BIC')
-        
-        return bic
+        # BICFI (v12) or BIC (v02) in one lookup; interned as a handful of banks
+        # recur across every transaction of a file
+        bic = get_text(agt, self._p_agent_bic)
+        return sys.intern(bic) if bic else bic
     
     def parse_related_party(self, party: Optional[ET.Element], 
                            party_account: Optional[ET.Element] = None,
@@ -115,14 +173,14 @@ class HelperParsers:
         if party is None:
             return None
         
-        name = get_text(party, f'{self.namespace}Nm')
+        name = get_text(party, self._p_nm)
         
-        contact_dtls = party.find(f'{self.namespace}CtctDtls')
+        contact_dtls = self._p_ctct_dtls(party)
         contact_info = None
         if contact_dtls is not None:
             contact_info = {
-                'email': get_text(contact_dtls, f'{self.namespace}EmailAdr'),
-                'other': get_text(contact_dtls, f'{self.namespace}Othr')
+                'email': get_text(contact_dtls, self._p_email),
+                'other': get_text(contact_dtls, self._p_othr)
             }
         
         # Parse account details
@@ -131,12 +189,7 @@ class HelperParsers:
         # Parse agent BIC
         agent_bic = self._parse_agent_bic(party_agent)
         
-        return RelatedParty(
-            name=name, 
-            account=account,
-            agent_bic=agent_bic,
-            contact_details=contact_info
-        )
+        return RelatedParty(name, account, agent_bic, contact_info)
     
     def parse_remittance_info(self, rmt_inf: Optional[ET.Element]) -> Optional[RemittanceInformation]:
         """
@@ -151,16 +204,10 @@ class HelperParsers:
         if rmt_inf is None:
             return None
         
-        unstructured = []
-        ustrd_elements = rmt_inf.findall(f'{self.namespace}Ustrd')
-        for ustrd in ustrd_elements:
-            if ustrd.text:
-                unstructured.append(ustrd.text)
+        # Text nodes straight from one XPath call (lxml) or a single filtered comprehension
+        unstructured = self._p_ustrd.texts(rmt_inf)
         
-        if not unstructured:
-            return None
-        
-        return RemittanceInformation(unstructured=unstructured)
+        return RemittanceInformation(unstructured) if unstructured else None
     
     def parse_return_info(self, rtr_inf: Optional[ET.Element]) -> Optional[ReturnInformation]:
         """
@@ -175,15 +222,10 @@ class HelperParsers:
         if rtr_inf is None:
             return None
         
-        reason_code = get_text(
-            rtr_inf, f'{self.namespace}Rsn/{self.namespace}Cd'
-        )
-        additional_info = get_text(rtr_inf, f'{self.namespace}AddtlInf')
+        reason_code = get_text(rtr_inf, self._p_rsn_cd)
+        additional_info = get_text(rtr_inf, self._p_addtl_inf)
         
         if not reason_code and not additional_info:
             return None
         
-        return ReturnInformation(
-            reason_code=reason_code,
-            additional_info=additional_info
-        )
\ No newline at end of file
+        return ReturnInformation(reason_code, additional_info)
\ No newline at end of file
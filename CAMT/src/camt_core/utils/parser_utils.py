@@ -2,10 +2,104 @@
 Utility Functions
 Low-level helper functions for XML processing and data conversion
 """
+import re
 import xml.etree.ElementTree as ET
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterator, List, Optional, Union
 from datetime import datetime, date
 
+try:
+    from lxml.etree import ETXPath, _Element as LxmlElement, tostring as lxml_tostring
+except ImportError:  # lxml not available - helpers below fall back to ElementTree
+    ETXPath = None
+    LxmlElement = None
+    lxml_tostring = None
+
+
+class CompiledPath:
+    """
+    Child path compiled once and reused across elements
+    
+    Evaluates as a precompiled lxml XPath on lxml elements and falls back to
+    Element.find for ElementTree elements.
+    
+    Example:
+        >>> acct_id = CompiledPath(f'{ns}Id/{ns}Othr/{ns}Id')
+        >>> get_text(acct, acct_id, required=True)
+        '032999999994'
+    """
+    __slots__ = ('path', '_xpath', '_first_text_xpath', '_texts_xpath')
+    
+    def __init__(self, path: str):
+        self.path = path
+        if ETXPath is not None:
+            self._xpath = ETXPath(path, smart_strings=False)
+            self._first_text_xpath = ETXPath(f'({path})[1]/text()', smart_strings=False)
+            self._texts_xpath = ETXPath(f'{path}/text()', smart_strings=False)
+        else:
+            self._xpath = self._first_text_xpath = self._texts_xpath = None
+    
+    def __call__(self, element: ET.Element) -> Optional[ET.Element]:
+        if self._xpath is not None and isinstance(element, LxmlElement):
+            matches = self._xpath(element)
+            return matches[0] if matches else None
+        return element.find(self.path)
+    
+    def text(self, element: ET.Element) -> Optional[str]:
+        """Raw text of the first match, read without creating an element proxy on lxml"""
+        if self._first_text_xpath is not None and isinstance(element, LxmlElement):
+            texts = self._first_text_xpath(element)
+            return texts[0] if texts else None
+        elem = element.find(self.path)
+        return elem.text if elem is not None else None
+    
+    def texts(self, element: ET.Element) -> List[str]:
+        """Non-empty raw texts of all matches"""
+        if self._texts_xpath is not None and isinstance(element, LxmlElement):
+            return self._texts_xpath(element)
+        return [text for elem in element.iterfind(self.path) if (text := elem.text)]
+    
+    def __str__(self) -> str:
+        return self.path
+
+
+class CompiledChoice:
+    """
+    Alternative child paths of an XML choice, compiled into one union XPath
+    
+    On lxml elements a single XPath evaluation returns the first text found in
+    document order; ElementTree elements try the paths in the given order. The
+    two agree because the alternatives of a choice are mutually exclusive.
+    
+    Example:
+        >>> acct_id = CompiledChoice(f'{ns}Id/{ns}IBAN', f'{ns}Id/{ns}Othr/{ns}Id')
+        >>> get_text(acct, acct_id)
+        '032999999994'
+    """
+    __slots__ = ('paths', '_text_xpath')
+    
+    def __init__(self, *paths: str):
+        self.paths = paths
+        if ETXPath is not None:
+            union = ' | '.join(f'{path}/text()' for path in paths)
+            self._text_xpath = ETXPath(f'({union})[1]', smart_strings=False)
+        else:
+            self._text_xpath = None
+    
+    def text(self, element: ET.Element) -> Optional[str]:
+        """Raw text of the first alternative present"""
+        if self._text_xpath is not None and isinstance(element, LxmlElement):
+            texts = self._text_xpath(element)
+            return texts[0] if texts else None
+        for path in self.paths:
+            elem = element.find(path)
+            if elem is not None and elem.text:
+                return elem.text
+        return None
+    
+    def __str__(self) -> str:
+        return ' | '.join(self.paths)
+
 
 def extract_namespace(element: ET.Element) -> str:
     """
@@ -27,13 +121,14 @@ def extract_namespace(element: ET.Element) -> str:
     return ''
 
 
-def get_text(element: ET.Element, path: str, required: bool = False) -> Optional[str]:
+def get_text(element: ET.Element, path: Union[str, CompiledPath, CompiledChoice],
+             required: bool = False) -> Optional[str]:
     """
     Safely extracts text from XML element
     
     Args:
         element: Parent XML element
-        path: XPath to child element
+        path: XPath to child element (string, CompiledPath or CompiledChoice)
         required: Whether element is required (raises error if missing)
         
     Returns:
@@ -46,28 +141,153 @@ def get_text(element: ET.Element, path: str, required: bool = False) -> Optional
         >>> get_text(element, 'ns:Name', required=True)
         'John Doe'
     """
-    elem = element.find(path)
+    if isinstance(path, str):
+        elem = element.find(path)
+        text = elem.text if elem is not None else None
+    else:
+        text = path.text(element)
+    if text:
+        return text.strip()
+    
+    if required:
+        raise ValueError(f"Required element not found: {path}")
+    
+    return None
+
+
+def collect_children(element: ET.Element, tags: FrozenSet[str]) -> Dict[str, ET.Element]:
+    """
+    Collects wanted direct children in a single pass
+    
+    Args:
+        element: Parent XML element
+        tags: Fully qualified tags to keep
+        
+    Returns:
+        Dict mapping tag to the first child with that tag
+    """
+    found = {}
+    for child in element:
+        tag = child.tag
+        if tag in tags and tag not in found:
+            found[tag] = child
+    return found
+
+
+def child_text(children: Dict[str, ET.Element], tag: str, required: bool = False,
+               sub_tag: Optional[str] = None) -> Optional[str]:
+    """
+    Extracts text from a child collected by collect_children
+    
+    Args:
+        children: Result of collect_children
+        tag: Fully qualified child tag
+        required: Whether element is required (raises error if missing)
+        sub_tag: Optional tag to descend into below the child
+        
+    Returns:
+        Stripped text content or None if not found
+        
+    Raises:
+        ValueError: If required=True and element not found
+    """
+    elem = children.get(tag)
+    if elem is not None and sub_tag is not None:
+        elem = elem.find(sub_tag)
     if elem is not None and elem.text:
         return elem.text.strip()
     
     if required:
+        path = f"{tag}/{sub_tag}" if sub_tag is not None else tag
         raise ValueError(f"Required element not found: {path}")
     
     return None
 
 
+def iter_children(element: ET.Element, tag: str) -> Iterator[ET.Element]:
+    """
+    Iterates direct children with the given tag
+    
+    Uses lxml's C-level iterchildren when the element comes from lxml and
+    falls back to ElementTree's iterfind otherwise.
+    
+    Args:
+        element: Parent XML element
+        tag: Fully qualified child tag
+        
+    Returns:
+        Iterator over matching child elements
+    """
+    iterchildren = getattr(element, 'iterchildren', None)
+    if iterchildren is not None:
+        return iterchildren(tag)
+    return element.iterfind(tag)
+
+
+def element_to_bytes(element: ET.Element) -> bytes:
+    """
+    Serializes an lxml or ElementTree element with its own library
+    
+    Args:
+        element: XML element
+        
+    Returns:
+        Serialized XML bytes
+    """
+    if LxmlElement is not None and isinstance(element, LxmlElement):
+        return lxml_tostring(element)
+    return ET.tostring(element)
+
+
+@lru_cache(maxsize=None)
+def _bsb_re(width: int) -> re.Pattern:
+    # Group 1: text before the first dash ("032-999999994"); group 2: leading digits
+    return re.compile(rf'([^-]*)-|(\d{{{width}}})')
+
+
+def extract_bsb(account_id: Optional[str], width: int) -> Optional[str]:
+    """
+    Extracts the BSB prefix from an account identifier
+    
+    Args:
+        account_id: Account identifier, either "BSB-ACCOUNT" or digits only
+        width: Number of leading digits taken as BSB when there is no dash
+        
+    Returns:
+        Part before the first dash, else the leading digits, or None
+        
+    Example:
+        >>> extract_bsb('032-999999994', 3)
+        '032'
+        >>> extract_bsb('032999999994', 6)
+        '032999'
+    """
+    if not account_id:
+        return None
+    match = _bsb_re(width).match(account_id)
+    return match[match.lastindex] if match else None
+
+
+# Formats keyed on whether the string contains '-': only the ISO formats have the
+# literal dash, so the other group can never match and is skipped outright
+_DATE_FORMATS = {True: ('%Y-%m-%d',), False: ('%Y%m%d',)}
+_DATETIME_FORMATS = {True: ('%Y-%m-%dT%H:%M:%S',), False: ('%Y%m%d%H%M%S', '%Y%m%d')}
+
+
+@lru_cache(maxsize=4096)
 def parse_date(date_str: str) -> date:
-    for fmt in ('%Y-%m-%d', '%Y%m%d'):
+    for fmt in _DATE_FORMATS['-' in date_str]:
         try:
             return datetime.strptime(date_str, fmt).date()
         except ValueError:
             continue
     raise ValueError(f"Unsupported date format: {date_str}")
 
+@lru_cache(maxsize=4096)
 def parse_datetime(dt_str: str) -> datetime:
-    for fmt in ('%Y-%m-%dT%H:%M:%S', '%Y%m%d%H%M%S', '%Y%m%d'):
+    for fmt in _DATETIME_FORMATS['-' in dt_str]:
         try:
             return datetime.strptime(dt_str, fmt)
         except ValueError:
             continue
-    raise ValueError(f"Unsupported datetime format: {dt_str}")
\ No newline at end of file
+    raise ValueError(f"Unsupported datetime format: {dt_str}")
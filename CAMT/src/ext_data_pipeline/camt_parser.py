@@ -4,26 +4,48 @@ Inherits from BaseParser and implements CAMT-specific logic
 """
 import logging
 import re
-from typing import Any, Optional
+from typing import Any, BinaryIO, Optional, Union
 
 from common.base_parser import BaseParser
 from common.validator.central_validator import ValidationError
+from gcp_services.gcs_service import open_file_stream_from_gcs
 from CAMT.src.camt_core.camt_parse import CAMT053Parser
 from CAMT.src.ext_data_pipeline.transformer import CAMTTransformer
 from CAMT.src.ext_data_pipeline.config import settings as camt_settings
 
 logger = logging.getLogger(__name__)
 
+_CAMT_VERSION_RE = re.compile(r'xmlns="[^"]*camt\.053\.001\.(\d+)"')
+_CAMT_NAMESPACE_VERSION_RE = re.compile(r'camt\.053\.001\.(\d+)')
+
 
 class CAMTParser(BaseParser):
     """CAMT.053 XML file format parser implementation."""
     
-    def parse_file_content(self, file_content: str, **kwargs) -> Any:
+    def read_file_content(self, gcs_path: str) -> Union[str, BinaryIO]:
+        """
+        Open the CAMT file as a GCS stream instead of downloading it whole,
+        unless streaming is turned off in the CAMT settings.
+        
+        Args:
+            gcs_path: GCS path (bucket_name/blob_name)
+            
+        Returns:
+            Binary stream consumed (and closed) by parse_file_content, or the
+            downloaded text when CAMT_STREAMING is off
+        """
+        if camt_settings.CAMT_STREAMING:
+            return open_file_stream_from_gcs(gcs_path)
+        return super().read_file_content(gcs_path)
+    
+    def parse_file_content(self, file_content: Union[str, bytes, BinaryIO], **kwargs) -> Any:
         """
         Parse CAMT.053 XML file content with version validation.
         
         Args:
-            file_content: Raw XML file content
+            file_content: Raw XML file content, parsed in memory, or a binary
+                stream which is parsed incrementally as it downloads and
+                closed afterwards
             **kwargs: Additional arguments
             
         Returns:
@@ -32,8 +54,39 @@ class CAMTParser(BaseParser):
         Raises:
             ValidationError: If CAMT version is not supported
         """
-        # Extract CAMT version from XML namespace
-        camt_version = self._extract_camt_version(file_content)
+        parser = CAMT053Parser(logger=logger)
+        
+        if hasattr(file_content, 'read'):
+            with file_content:
+                # The version sits in the root element's namespace, so the stream is
+                # read only until the root start tag; the parser carries on from
+                # those bytes rather than rewinding the stream
+                head, namespace = CAMT053Parser._sniff_namespace(file_content)
+                self._validate_camt_version(self._camt_version_from_namespace(namespace))
+                
+                # Parse XML incrementally so the full DOM never sits alongside the raw content
+                logger.info("Parsing CAMT.053 XML stream...")
+                document = parser.parse_stream(file_content, head=head)
+        else:
+            self._validate_camt_version(self._extract_camt_version(file_content))
+            
+            logger.info("Parsing CAMT.053 XML...")
+            document = parser.parse_string(file_content, parallel=camt_settings.CAMT_PARALLEL)
+        
+        logger.info(f"Parsed CAMT document with {len(document.statements)} statements")
+        
+        return document
+    
+    def _validate_camt_version(self, camt_version: str) -> None:
+        """
+        Validate the CAMT version declared in the document namespace.
+        
+        Args:
+            camt_version: CAMT version string (e.g., 'camt.053.001.02')
+            
+        Raises:
+            ValidationError: If CAMT version is not supported
+        """
         logger.info(f"Detected CAMT version: {camt_version}")
         
         # Validate schema version
@@ -43,14 +96,6 @@ class CAMTParser(BaseParser):
         except ValidationError as e:
             logger.error(f"CAMT schema version validation failed: {e}")
             raise
-        
-        # Parse XML
-        logger.info("Parsing CAMT.053 XML...")
-        parser = CAMT053Parser(logger=logger)
-        document = parser.parse_string(file_content)
-        logger.info(f"Parsed CAMT document with {len(document.statements)} statements")
-        
-        return document
     
     def get_transformer(self, org_id: str, div_id: str, **kwargs):
         """
@@ -64,7 +109,8 @@ class CAMTParser(BaseParser):
         Returns:
             CAMTTransformer instance
         """
-        return CAMTTransformer(org_id, div_id, self.config_loader)
+        return CAMTTransformer(org_id, div_id, self.config_loader,
+                               parallel=camt_settings.CAMT_PARALLEL)
     
     def get_table_type_from_filename(self, filename: str) -> Optional[str]:
         """
@@ -79,7 +125,8 @@ class CAMTParser(BaseParser):
         """
         return None
     
-    def _extract_camt_version(self, xml_content: str) -> str:
+    @staticmethod
+    def _extract_camt_version(xml_content: Union[str, bytes]) -> str:
         """
         Extract CAMT version from XML namespace.
         
@@ -89,9 +136,36 @@ class CAMTParser(BaseParser):
         Returns:
             CAMT version string (e.g., 'camt.053.001.02')
         """
-        namespace_match = re.search(r'xmlns="[^"]*camt\.053\.001\.(\d+)"', xml_content)
-        if namespace_match:
-            version_number = namespace_match.group(1)
+        if isinstance(xml_content, bytes):
+            xml_content = xml_content.decode('utf-8', errors='ignore')
+        return CAMTParser._format_camt_version(_CAMT_VERSION_RE.search(xml_content))
+    
+    @staticmethod
+    def _camt_version_from_namespace(namespace: str) -> str:
+        """
+        Extract CAMT version from the root element namespace.
+        
+        Args:
+            namespace: Namespace string like '{urn:...:camt.053.001.02}' or empty string
+            
+        Returns:
+            CAMT version string (e.g., 'camt.053.001.02')
+        """
+        return CAMTParser._format_camt_version(_CAMT_NAMESPACE_VERSION_RE.search(namespace))
+    
+    @staticmethod
+    def _format_camt_version(version_match: Optional[re.Match]) -> str:
+        """
+        Build the CAMT version string from a version regex match.
+        
+        Args:
+            version_match: Match whose first group is the version number, or None
+            
+        Returns:
+            CAMT version string, camt.053.001.02 when there was no match
+        """
+        if version_match:
+            version_number = version_match.group(1)
             return f'camt.053.001.{version_number.zfill(2)}'
         else:
             # Default to version 02 if not found
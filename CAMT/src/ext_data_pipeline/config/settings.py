@@ -2,7 +2,7 @@
 """
 CAMT-specific settings
 """
-
+import os
 from pathlib import Path
 
 # Schema configuration path
@@ -12,3 +12,9 @@ SCHEMA_PATH = str(CAMT_MODULE_DIR / "common" / "schema" / "target_bq_schema.json
 
 CAMT_SUPPORTED_VERSIONS =['camt.053.001.02']
 
+# Parse and transform multi-statement documents across worker processes (set CAMT_PARALLEL=1)
+CAMT_PARALLEL = os.environ.get("CAMT_PARALLEL", "0") == "1"
+
+# Parse CAMT files from a GCS stream instead of downloading them whole first;
+# bounds memory for large files (set CAMT_STREAMING=0 for the in-memory parse)
+CAMT_STREAMING = os.environ.get("CAMT_STREAMING", "1") == "1"
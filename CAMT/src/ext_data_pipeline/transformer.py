@@ -3,19 +3,56 @@ CAMT Transformer - Transforms CAMT.053 statements to BigQuery rows
 Inherits from BaseTransformer
 """
 import logging
-from typing import List, Dict, Any
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 from decimal import Decimal
 
 from common.base_transformer import BaseTransformer
+from common.config_loader.config_loader import ConfigLoader
 from common.env_variables.settings import BALANCE_TABLE_ID, TRANSACTIONS_TABLE_ID
 from CAMT.src.camt_core.models.camt_model import Statement, BankToCustomerStatement
+from CAMT.src.camt_core.utils.parser_utils import extract_bsb
 
 logger = logging.getLogger(__name__)
 
+_ZERO = Decimal('0')
+
+# Below this many statements, worker start-up costs more than the parallel transform saves
+_PARALLEL_MIN_STATEMENTS = 4
+
+# Table ids are stored in every row; intern them so all rows share one object
+_BALANCE_TABLE = sys.intern(BALANCE_TABLE_ID)
+_TRANSACTIONS_TABLE = sys.intern(TRANSACTIONS_TABLE_ID)
+
+
+def _to_cents(amount) -> int:
+    """Convert an amount to integer cents, shifting the exponent for Decimals."""
+    if isinstance(amount, Decimal):
+        return int(amount.scaleb(2))
+    return int(round(amount * 100))
+
 
 class CAMTTransformer(BaseTransformer):
     """Transforms CAMT.053 documents into schema-compliant BigQuery rows."""
     
+    def __init__(self, org_id: str, div_id: str, config_loader: ConfigLoader,
+                 parallel: bool = False):
+        """
+        Initialize CAMT transformer.
+        
+        Args:
+            org_id: Organisation business ID
+            div_id: Division business ID
+            config_loader: ConfigLoader instance
+            parallel: Transform multi-statement documents across worker processes
+        """
+        super().__init__(org_id, div_id, config_loader)
+        self.parallel = parallel
+        # Common fields are the same for every row of every statement
+        self._common_fields = self._get_common_fields()
+    
     def transform(self, parsed_data: BankToCustomerStatement, table_type: str = None) -> List[Dict]:
         """
         Transform CAMT.053 document into BigQuery-ready rows.
@@ -27,119 +64,161 @@ class CAMTTransformer(BaseTransformer):
         Returns:
             List of transformed rows (both balance and transaction rows)
         """
-        logger.info(f"Transforming {len(parsed_data.statements)} CAMT statement(s)")
+        statements = parsed_data.statements
+        logger.info(f"Transforming {len(statements)} CAMT statement(s)")
+        
+        if self.parallel and len(statements) >= _PARALLEL_MIN_STATEMENTS:
+            per_statement = self._transform_statements_parallel(statements)
+        else:
+            per_statement = map(self._transform_statement, statements)
         
         transformed_rows = []
         
-        for idx, statement in enumerate(parsed_data.statements, start=1):
-            logger.debug(f"Processing statement {idx}/{len(parsed_data.statements)}")
-            
-            # Transform balance data
-            balance_row = self._transform_balance(statement)
-            transformed_rows.append(balance_row)
+        for idx, (balance_row, transaction_rows) in enumerate(per_statement, start=1):
+            logger.debug(f"Processing statement {idx}/{len(statements)}")
             
-            # Transform transaction entries
-            transaction_rows = self._transform_transactions(statement)
-            transformed_rows.extend(transaction_rows)
+            # Each list targets one table, so defaults are applied without per-row dispatch
+            transformed_rows.extend(self.apply_table_defaults([balance_row], _BALANCE_TABLE))
+            transformed_rows.extend(self.apply_table_defaults(transaction_rows, _TRANSACTIONS_TABLE))
             
             logger.debug(f"Statement {idx}: 1 balance + {len(transaction_rows)} transactions")
         
-        logger.info(f"Transformed {len(transformed_rows)} total rows")
+        logger.info(f"Transformed {len(transformed_rows)} total rows with default values applied")
         
-        # Apply default values before returning
-        return self.apply_default_values(transformed_rows)
+        return transformed_rows
     
-    def _transform_balance(self, statement: Statement) -> Dict:
+    def _transform_statement(self, statement: Statement) -> Tuple[Dict, List[Dict]]:
+        """Transform one statement into its balance row and transaction rows."""
+        account_fields = self._get_account_fields(statement)
+        return (self._transform_balance(statement, account_fields),
+                self._transform_transactions(statement, account_fields))
+    
+    def _transform_statements_parallel(self, statements: List[Statement]) -> List[Tuple[Dict, List[Dict]]]:
+        """
+        Transform independent statements across worker processes.
+        
+        Args:
+            statements: Parsed statements
+            
+        Returns:
+            (balance_row, transaction_rows) per statement, in document order
+        """
+        # Lazily parsed details hold XML elements, which cannot be pickled; load them here
+        for statement in statements:
+            for entry in statement.entries:
+                entry.load_details()
+        
+        workers = min(len(statements), os.cpu_count() or 1)
+        chunksize = max(1, len(statements) // (4 * workers))
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_transform_worker,
+            initargs=(self.org_id, self.div_id, self.config_loader)
+        ) as executor:
+            return list(executor.map(_transform_statement_in_worker, statements, chunksize=chunksize))
+    
+    def _get_account_fields(self, statement: Statement) -> Dict:
+        """Build the common and account fields shared by all rows of a statement."""
+        account = statement.account
+        account_id = account.id
+        
+        return {
+            **self._common_fields,
+            "account_name": getattr(account, 'name', None),
+            "account_number": account_id,
+            "bsb": self._extract_bsb(account_id),
+            "financial_institute": account.servicer.bic,
+            "currency": account.currency,
+        }
+    
+    def _transform_balance(self, statement: Statement, account_fields: Dict) -> Dict:
         """Transform statement balances into balance table row."""
         closing_bal = statement.get_closing_balance()
         opening_bal = statement.get_opening_balance()
         
-        account_id = statement.account.id
-        bsb = self._extract_bsb(account_id)
-        
-        row = self._get_common_fields()
-        row.update({
-            "_target_table": BALANCE_TABLE_ID,
-            "account_name": statement.account.name if hasattr(statement.account, 'name') else None,
-            "account_number": account_id,
-            "bsb": bsb,
-            "financial_institute": statement.account.servicer.bic,
+        return {
+            **account_fields,
+            "_target_table": _BALANCE_TABLE,
             "balance_date": statement.creation_datetime.date().isoformat(),
-            "currency": statement.account.currency,
-            "closing_balance": int(closing_bal.amount * 100) if closing_bal else 0,
-            "opening_balance": int(opening_bal.amount * 100) if opening_bal else 0,
+            "closing_balance": _to_cents(closing_bal.amount if closing_bal else _ZERO),
+            "opening_balance": _to_cents(opening_bal.amount if opening_bal else _ZERO),
             "overdraft_limit": None
-        })
-        
-        return row
+        }
     
-    def _transform_transactions(self, statement: Statement) -> List[Dict]:
+    def _transform_transactions(self, statement: Statement, account_fields: Dict) -> List[Dict]:
         """Transform statement entries into transaction table rows."""
         rows = []
+        append = rows.append
+        format_swift_code = self._format_swift_code
+        to_cents = _to_cents
         
-        account_id = statement.account.id
-        bsb = self._extract_bsb(account_id)
+        # Account values are constant for the whole statement, so they go into
+        # the base every row is built from
+        base = {**account_fields, "_target_table": _TRANSACTIONS_TABLE}
         
         for entry in statement.entries:
-            for detail in entry.transaction_details:
-                is_credit = entry.credit_debit_indicator.value == "CRDT"
-                
+            # Entry-level values are shared by every detail of the entry
+            transaction_type = entry.credit_debit_indicator.value
+            is_credit = transaction_type == "CRDT"
+            posting_date = entry.booking_date.isoformat()
+            value_date = entry.value_date.isoformat()
+            
+            for detail in entry.load_details():
                 # Get counterparty (opposite party)
                 counterparty = detail.debtor if is_credit else detail.creditor
                 
                 # Extract counterparty details
-                counterparty_name = None
-                counterparty_account = None
-                counterparty_bsb = None
-                counterparty_fi = None
-                
-                if counterparty:
-                    counterparty_name = counterparty.name if hasattr(counterparty, 'name') else None
-                    
-                    if counterparty.account:
-                        counterparty_account = counterparty.account.account_id
-                        counterparty_bsb = counterparty.account.bsb
-                    
+                if counterparty is None:
+                    counterparty_name = counterparty_account = counterparty_bsb = counterparty_fi = None
+                else:
+                    counterparty_name = getattr(counterparty, 'name', None)
                     counterparty_fi = counterparty.agent_bic
+                    
+                    party_account = counterparty.account
+                    if party_account is None:
+                        counterparty_account = counterparty_bsb = None
+                    else:
+                        counterparty_account = party_account.account_id
+                        counterparty_bsb = party_account.bsb
                 
-                # Build transaction row
-                row = self._get_common_fields()
-                row.update({
-                    "_target_table": TRANSACTIONS_TABLE_ID,
-                    "account_name": statement.account.name if hasattr(statement.account, 'name') else None,
-                    "account_number": account_id,
-                    "bsb": bsb,
-                    "financial_institute": statement.account.servicer.bic,
+                # Build transaction row in one go so the dict is sized once
+                append({
+                    **base,
                     "counterparty_name": counterparty_name,
                     "counterparty_account_number": counterparty_account,
                     "counterparty_account_bsb": counterparty_bsb,
                     "counterparty_financial_institute": counterparty_fi,
-                    "transaction_posting_date": entry.booking_date.isoformat(),
-                    "transaction_value_date": entry.value_date.isoformat(),
-                    "currency": statement.account.currency,
-                    "transaction_amount": int(detail.amount * 100),
-                    "transaction_type": entry.credit_debit_indicator.value,
-                    "swift_transaction_code": self._format_swift_code(detail.bank_transaction_code)
+                    "transaction_posting_date": posting_date,
+                    "transaction_value_date": value_date,
+                    "transaction_amount": to_cents(detail.amount),
+                    "transaction_type": transaction_type,
+                    "swift_transaction_code": format_swift_code(detail.bank_transaction_code)
                 })
-                
-                rows.append(row)
         
         return rows
     
     def _extract_bsb(self, account_id: str) -> str:
         """Extract BSB from account ID."""
-        if not account_id:
-            return None
-        
-        if "-" in account_id:
-            return account_id.split("-")[0]
-        elif len(account_id) >= 6 and account_id[:6].isdigit():
-            return account_id[:6]
-        
-        return None
+        return extract_bsb(account_id, 6)
     
     def _format_swift_code(self, btc) -> str:
         """Format bank transaction code as SWIFT code string."""
-        if not btc:
-            return None
-        return f"{btc.domain_code}-{btc.family_code}-{btc.sub_family_code}"
\ No newline at end of file
+        if btc:
+            return "-".join((btc.domain_code, btc.family_code, btc.sub_family_code))
+        return None
+
+
+# Set in each worker process by _init_transform_worker
+_worker_transformer: Optional[CAMTTransformer] = None
+
+
+def _init_transform_worker(org_id: str, div_id: str, config_loader: ConfigLoader) -> None:
+    """Build the worker's transformer once, with a copy of the parent's config loader."""
+    global _worker_transformer
+    _worker_transformer = CAMTTransformer(org_id, div_id, config_loader)
+
+
+def _transform_statement_in_worker(statement: Statement) -> Tuple[Dict, List[Dict]]:
+    """Transform one statement in a worker process."""
+    return _worker_transformer._transform_statement(statement)
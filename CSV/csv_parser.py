@@ -4,13 +4,14 @@ Inherits from BaseParser and implements CSV-specific logic
 """
 import logging
 import csv
-from io import StringIO
-from typing import Any, List, Dict
+from io import StringIO, TextIOWrapper
+from typing import Any, BinaryIO, Dict, Iterator, Union
 
 from common.base_parser import BaseParser
 from common.env_variables.settings import BALANCE_TABLE_ID, TRANSACTIONS_TABLE_ID
+from gcp_services.gcs_service import open_file_stream_from_gcs
 from CSV.transformer import CSVTransformer
-from CSV.utils.csv_helper import clean_csv_row
+from CSV.utils.csv_helper import clean_csv_fields
 
 logger = logging.getLogger(__name__)
 
@@ -18,29 +19,74 @@ logger = logging.getLogger(__name__)
 class CSVParser(BaseParser):
     """CSV file format parser implementation."""
     
-    def parse_file_content(self, file_content: str, **kwargs) -> List[Dict]:
+    def read_file_content(self, gcs_path: str) -> BinaryIO:
         """
-        Parse CSV file content.
+        Open the CSV file as a GCS stream instead of downloading it whole.
         
         Args:
-            file_content: Raw CSV file content
+            gcs_path: GCS path (bucket_name/blob_name)
+            
+        Returns:
+            Binary stream consumed (and closed) by parse_file_content
+        """
+        return open_file_stream_from_gcs(gcs_path)
+    
+    def parse_file_content(self, file_content: Union[str, BinaryIO], **kwargs) -> Iterator[Dict]:
+        """
+        Parse CSV file content lazily.
+        
+        Rows are cleaned as the transformer consumes them, so only the
+        transformed rows are ever held in memory as a list.
+        
+        Args:
+            file_content: Raw CSV file content, or a binary stream which is
+                parsed as it downloads and closed once exhausted
             **kwargs: Additional arguments
             
         Returns:
-            List of parsed row dictionaries
+            Iterator of parsed row dictionaries
         """
         logger.info("Parsing CSV file...")
         
-        rows = []
-        csv_file = StringIO(file_content)
-        reader = csv.DictReader(csv_file)
+        if hasattr(file_content, 'read'):
+            return self._iter_csv_stream(file_content)
+        
+        return self._iter_csv(StringIO(file_content))
+    
+    def _iter_csv_stream(self, stream: BinaryIO) -> Iterator[Dict]:
+        """
+        Parse rows from a binary CSV stream, closing it when done.
+        
+        Args:
+            stream: UTF-8 encoded binary stream positioned at the header row
+            
+        Yields:
+            Parsed row dictionaries
+        """
+        with TextIOWrapper(stream, encoding='utf-8', newline='') as csv_file:
+            yield from self._iter_csv(csv_file)
+    
+    def _iter_csv(self, csv_file) -> Iterator[Dict]:
+        """
+        Parse rows from a text CSV file object.
+        
+        Args:
+            csv_file: Text file object positioned at the header row
+            
+        Yields:
+            Parsed row dictionaries
+        """
+        # Plain lists from csv.reader; each row dict is built once, after cleaning
+        reader = csv.reader(csv_file)
+        header = next(reader, None)
         
-        for row in reader:
-            cleaned_row = clean_csv_row(row)
-            rows.append(cleaned_row)
+        # Header names are the same for every row, so clean them once up front
+        fieldnames = [name.strip() for name in header] if header else []
         
-        logger.info(f"Parsed {len(rows)} rows from CSV")
-        return rows
+        # Blank lines are skipped, as csv.DictReader does
+        for values in reader:
+            if values:
+                yield clean_csv_fields(fieldnames, values)
     
     def get_transformer(self, org_id: str, div_id: str, **kwargs):
         """
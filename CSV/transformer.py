@@ -3,7 +3,7 @@ CSV Transformer - Transforms parsed CSV data to BigQuery rows
 Inherits from BaseTransformer
 """
 import logging
-from typing import List, Dict, Any
+from typing import Iterable, List, Dict, Any
 
 from common.base_transformer import BaseTransformer
 
@@ -13,12 +13,12 @@ logger = logging.getLogger(__name__)
 class CSVTransformer(BaseTransformer):
     """Transforms CSV rows into schema-compliant BigQuery rows."""
     
-    def transform(self, parsed_data: List[Dict], table_type: str = None) -> List[Dict]:
+    def transform(self, parsed_data: Iterable[Dict], table_type: str = None) -> List[Dict]:
         """
         Transform CSV rows into BigQuery-ready rows.
         
         Args:
-            parsed_data: List of parsed CSV row dictionaries
+            parsed_data: Parsed CSV row dictionaries (list or lazy iterator)
             table_type: Target table ID (BALANCE_TABLE_ID or TRANSACTIONS_TABLE_ID)
             
         Returns:
@@ -27,29 +27,37 @@ class CSVTransformer(BaseTransformer):
         if table_type is None:
             raise ValueError("CSV transformer requires table_type parameter")
         
-        logger.info(f"Transforming {len(parsed_data)} CSV rows for table: {table_type}")
+        logger.info(f"Transforming CSV rows for table: {table_type}")
         
         # Get common fields
         common_fields = self._get_common_fields()
         
-        transformed_rows = []
-        for row in parsed_data:
-            # Start with common fields
-            transformed_row = common_fields.copy()
-            
-            # Add all CSV data
-            transformed_row.update(row)
-            
-            # Add target table identifier
-            transformed_row["_target_table"] = table_type
-            
-            # Force org_id and div_id from bucket labels (override CSV values)
-            transformed_row["organisation_biz_id"] = self.org_id
-            transformed_row["division_biz_id"] = self.div_id
-            
-            transformed_rows.append(transformed_row)
+        org_id = self.org_id
+        div_id = self.div_id
+        
+        # Every row targets the same table, so its schema defaults are fetched once
+        # and merged while the row is built instead of in a second copying pass
+        defaults = self._get_defaults_for_target(table_type)
+        if defaults is None:
+            logger.warning(f"Unknown target table: {table_type}, skipping defaults")
+            defaults = {}
+        
+        # One dict display per row: common fields, then all CSV data, then the
+        # target table and org/div ids from bucket labels (overriding CSV values),
+        # then schema defaults
+        transformed_rows = [
+            {
+                **common_fields,
+                **row,
+                "_target_table": table_type,
+                "organisation_biz_id": org_id,
+                "division_biz_id": div_id,
+                **defaults,
+            }
+            for row in parsed_data
+        ]
         
-        logger.info(f"Transformed {len(transformed_rows)} rows for table '{table_type}'")
+        logger.info(f"Transformed {len(transformed_rows)} rows for table '{table_type}' "
+                    f"with {len(defaults)} default values applied")
         
-        # Apply default values before returning
-        return self.apply_default_values(transformed_rows)
\ No newline at end of file
+        return transformed_rows
\ No newline at end of file
@@ -3,8 +3,11 @@ Helper functions for data processing and cleaning
 """
 import logging
 import re
-from datetime import datetime
-from typing import Any, Dict, List
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from common.config_loader.config_loader import load_schema_file
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +24,27 @@ DATE_FORMATS = [
 ]
 
 
+def _date_separator(text: str) -> str:
+    """First date separator ('-', '/' or '.') found in text, or '' if none."""
+    return next((c for c in "-/." if c in text), "")
+
+
+# DATE_FORMATS grouped by separator, in their original order; a format can only
+# match a string containing its separator
+_DATE_FORMATS_BY_SEPARATOR: Dict[str, List[str]] = {}
+for _fmt in DATE_FORMATS:
+    _DATE_FORMATS_BY_SEPARATOR.setdefault(_date_separator(_fmt), []).append(_fmt)
+del _fmt
+
+# Common shapes resolved without strptime, as (pattern, (year, month, day) group numbers).
+# Each matches only strings whose first matching DATE_FORMATS entry gives the same date.
+_FAST_DATE_PATTERNS = [
+    (re.compile(r'([1-9]\d{3})-(\d{1,2})-(\d{1,2})'), (1, 2, 3)),   # %Y-%m-%d
+    (re.compile(r'(\d{1,2})/(\d{1,2})/([1-9]\d{3})'), (3, 2, 1)),   # %d/%m/%Y
+    (re.compile(r'([1-9]\d{3})(\d{2})(\d{2})'), (1, 2, 3)),         # %Y%m%d
+]
+
+
 def normalize_date(date_value: Any) -> str:
     """
     Converts various date formats to YYYY-MM-DD format.
@@ -34,19 +58,39 @@ def normalize_date(date_value: Any) -> str:
     Raises:
         ValueError: If date format is not recognized
     """
-    if date_value is None or str(date_value).strip() == "":
+    date_str = "" if date_value is None else str(date_value).strip()
+    if not date_str:
         raise ValueError("Date value is empty or None")
     
-    date_str = str(date_value).strip()
+    normalized = _normalize_date_str(date_str)
+    if normalized is None:
+        raise ValueError(f"Unable to parse date: {date_value}")
+    return normalized
+
+
+# CSV columns repeat the same dates and strings heavily, so results are cached per distinct value
+@lru_cache(maxsize=65536)
+def _normalize_date_str(date_str: str) -> Optional[str]:
+    """Normalize a stripped date string to YYYY-MM-DD, or None if no format matches."""
+    # Fast path: build the date straight from the digits; anything the
+    # pattern matches but cannot form a valid date falls through to strptime
+    for pattern, (year, month, day) in _FAST_DATE_PATTERNS:
+        match = pattern.fullmatch(date_str)
+        if match:
+            try:
+                return date(int(match[year]), int(match[month]), int(match[day])).isoformat()
+            except ValueError:
+                break
     
-    for fmt in DATE_FORMATS:
+    # Only formats using the string's separator can match
+    for fmt in _DATE_FORMATS_BY_SEPARATOR.get(_date_separator(date_str), ()):
         try:
             dt = datetime.strptime(date_str, fmt)
             return dt.strftime("%Y-%m-%d")
         except ValueError:
             continue
     
-    raise ValueError(f"Unable to parse date: {date_value}")
+    return None
 
 
 def clean_string(value: Any) -> str:
@@ -62,8 +106,14 @@ def clean_string(value: Any) -> str:
     if value is None:
         return None
     
-    cleaned = str(value).strip()
-    cleaned = re.sub(r'\s+', ' ', cleaned)
+    return _clean_str(str(value))
+
+
+@lru_cache(maxsize=65536)
+def _clean_str(value: str) -> Optional[str]:
+    """Strip and collapse whitespace in a string, or None if nothing is left."""
+    # split() breaks on the same whitespace as r'\s+' and drops the ends, all in C
+    cleaned = " ".join(value.split())
     
     return cleaned if cleaned else None
 
@@ -78,16 +128,51 @@ def clean_csv_row(row: Dict) -> Dict:
     Returns:
         Cleaned row dictionary
     """
-    cleaned_row = {}
-    for key, value in row.items():
-        cleaned_key = key.strip() if isinstance(key, str) else key
+    # clean_string already maps None and blank strings to None
+    return {
+        key.strip() if isinstance(key, str) else key: clean_string(value)
+        for key, value in row.items()
+    }
+
+
+def clean_csv_values(row: Dict) -> Dict:
+    """
+    Cleans the values of a CSV row whose keys are already clean.
+    
+    Args:
+        row: Dictionary representing a CSV row with stripped keys
         
-        if value is None or (isinstance(value, str) and value.strip() == ""):
-            cleaned_row[cleaned_key] = None
-        else:
-            cleaned_row[cleaned_key] = clean_string(value)
+    Returns:
+        Cleaned row dictionary
+    """
+    # clean_string already maps None and blank strings to None
+    return {key: clean_string(value) for key, value in row.items()}
+
+
+def clean_csv_fields(fieldnames: List[str], values: List[str]) -> Dict:
+    """
+    Builds a cleaned row dictionary from a csv.reader row.
     
-    return cleaned_row
+    Matches csv.DictReader: missing values become None and extra values are
+    collected as a list under the None key.
+    
+    Args:
+        fieldnames: Stripped header names
+        values: Raw values of one CSV row
+        
+    Returns:
+        Cleaned row dictionary
+    """
+    if len(values) != len(fieldnames):
+        row = dict(zip(fieldnames, values))
+        for name in fieldnames[len(values):]:
+            row[name] = None
+        if len(values) > len(fieldnames):
+            row[None] = values[len(fieldnames):]
+        return clean_csv_values(row)
+    
+    # csv.reader only yields strings, so they go straight to the cached cleaner
+    return dict(zip(fieldnames, map(_clean_str, values)))
 
 
 def validate_numeric(value: Any, field_name: str) -> float:
@@ -107,6 +192,10 @@ def validate_numeric(value: Any, field_name: str) -> float:
     if value is None:
         raise ValueError(f"{field_name} cannot be None")
     
+    # Numbers need no string round-trip (bool is excluded: "True" is not numeric)
+    if type(value) is int or type(value) is float:
+        return float(value)
+    
     try:
         numeric_value = float(str(value).strip().replace(",", ""))
     except (ValueError, AttributeError):
@@ -117,22 +206,19 @@ def validate_numeric(value: Any, field_name: str) -> float:
 
 def load_schema(schema_path: str) -> Dict:
     """
-    Loads schema from JSON file.
+    Loads schema from JSON file, parsed once per process.
     
     Args:
         schema_path: Path to schema JSON file
         
     Returns:
-        Schema dictionary
+        Schema dictionary (shared, do not modify)
     """
-    import json
-    
     try:
-        with open(schema_path, 'r') as f:
-            return json.load(f)
+        return load_schema_file(schema_path)
     except FileNotFoundError:
         logger.error(f"Schema file not found: {schema_path}")
         raise
-    except json.JSONDecodeError as e:
+    except ValueError as e:  # json.JSONDecodeError and orjson.JSONDecodeError both subclass it
         logger.error(f"Invalid JSON in schema file: {e}")
         raise
\ No newline at end of file
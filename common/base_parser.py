@@ -104,8 +104,7 @@ class BaseParser(ABC):
         logger.info(f"Extracted from bucket labels - Org: '{org_id}', Div: '{div_id}'")
         
         # Step 2: Read file content
-        file_content = read_file_from_gcs(gcs_path)
-        logger.info(f"Read file content: {len(file_content)} bytes")
+        file_content = self.read_file_content(gcs_path)
         
         # Step 3: Parse file (format-specific)
         parsed_object = self.parse_file_content(file_content, **parser_kwargs)
@@ -131,7 +130,11 @@ class BaseParser(ABC):
         logger.info(f"Validated {len(valid_rows)} rows")
         
         # Step 7: Encrypt sensitive fields
-        encrypted_rows = self._encrypt_rows(valid_rows)
+        try:
+            encrypted_rows = self._encrypt_rows(valid_rows)
+        finally:
+            # Release the encryption thread pool; it restarts if the parser is reused
+            self.encryptor.close()
         logger.info("Encrypted sensitive fields")
         
         # Step 8: Load to BigQuery
@@ -141,6 +144,21 @@ class BaseParser(ABC):
         logger.info(f"{self.__class__.__name__} processing complete")
         return {"rows_processed": rows_loaded}
     
+    def read_file_content(self, gcs_path: str) -> Any:
+        """
+        Read raw file content for parse_file_content.
+        Parsers that can consume a stream override this to avoid a full download.
+        
+        Args:
+            gcs_path: GCS path (bucket_name/blob_name)
+            
+        Returns:
+            File content passed to parse_file_content
+        """
+        file_content = read_file_from_gcs(gcs_path)
+        logger.info(f"Read file content: {len(file_content)} bytes")
+        return file_content
+    
     def _validate_rows(self, rows: List[Dict]) -> List[Dict]:
         """
         Validate rows using central validator.
@@ -154,9 +172,14 @@ class BaseParser(ABC):
         Raises:
             ValueError: If validation fails
         """
-        # Separate by table type
-        balance_rows = [r for r in rows if r.get("_target_table") == BALANCE_TABLE_ID]
-        tx_rows = [r for r in rows if r.get("_target_table") == TRANSACTIONS_TABLE_ID]
+        # Separate by table type in a single pass
+        balance_rows = []
+        tx_rows = []
+        buckets = {BALANCE_TABLE_ID: balance_rows, TRANSACTIONS_TABLE_ID: tx_rows}
+        for row in rows:
+            bucket = buckets.get(row.get("_target_table"))
+            if bucket is not None:
+                bucket.append(row)
         
         valid_rows = []
         all_errors = []
@@ -203,22 +226,26 @@ class BaseParser(ABC):
         Returns:
             List of encrypted rows
         """
-        encrypted_rows = []
+        encrypted_rows = list(rows)
         
-        for row in rows:
+        # Group row positions by table so each group goes to KMS as one concurrent batch
+        positions_by_table: Dict[str, List[int]] = {}
+        for i, row in enumerate(rows):
             target_table = row.get("_target_table")
+            positions_by_table.setdefault(target_table, []).append(i)
+        
+        for target_table, positions in positions_by_table.items():
             table_type = self._get_table_type_string(target_table)
             
             # Get sensitive fields from config loader
             sensitive_fields = self.config_loader.get_sensitive_fields(table_type)
+            if not sensitive_fields:
+                continue
             
-            # Encrypt row
-            if sensitive_fields:
-                encrypted_row = self.encryptor.encrypt_row(row, sensitive_fields)
-            else:
-                encrypted_row = row
-            
-            encrypted_rows.append(encrypted_row)
+            # Encrypt rows, writing them back in their original order
+            batch = self.encryptor.encrypt_rows([rows[i] for i in positions], sensitive_fields)
+            for i, encrypted_row in zip(positions, batch):
+                encrypted_rows[i] = encrypted_row
         
         return encrypted_rows
     
@@ -4,7 +4,7 @@ Provides common interface and default value application
 """
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from common.config_loader.config_loader import ConfigLoader
 from common.env_variables.settings import BALANCE_TABLE_ID, TRANSACTIONS_TABLE_ID
@@ -30,6 +30,7 @@ class BaseTransformer(ABC):
         self.org_id = org_id
         self.div_id = div_id
         self.config_loader = config_loader
+        self._defaults_by_table: Dict[str, Dict[str, Any]] = {}  # {target_table: defaults}
         logger.info(f"{self.__class__.__name__} initialized for org='{org_id}', div='{div_id}'")
     
     @abstractmethod
@@ -51,38 +52,74 @@ class BaseTransformer(ABC):
         """
         Apply default values from schema to rows based on their target table.
         
+        Rows are updated in place: callers pass rows they have just built
+        and own, so no per-row copies are made.
+        
         Args:
             rows: List of row dictionaries with _target_table field
             
         Returns:
-            List of rows with default values applied
+            The same list, with default values applied
         """
-        processed_rows = []
-        
         for row in rows:
             target_table = row.get("_target_table")
             
-            # Determine table type
-            if target_table == BALANCE_TABLE_ID:
-                table_type = "balance"
-            elif target_table == TRANSACTIONS_TABLE_ID:
-                table_type = "transactions"
-            else:
+            # Get defaults for the row's table
+            defaults = self._get_defaults_for_target(target_table)
+            if defaults is None:
                 logger.warning(f"Unknown target table: {target_table}, skipping defaults")
-                processed_rows.append(row)
                 continue
             
-            # Get defaults and apply
-            defaults = self.config_loader.get_default_values(table_type)
-            processed_row = row.copy()
+            if defaults:
+                row.update(defaults)
+        
+        logger.info(f"Applied default values to {len(rows)} rows")
+        return rows
+    
+    def apply_table_defaults(self, rows: List[Dict], target_table: str) -> List[Dict]:
+        """
+        Apply one table's default values to rows that all target that table.
+        
+        Like apply_default_values, but without a per-row table lookup; rows
+        are updated in place.
+        
+        Args:
+            rows: Row dictionaries for target_table
+            target_table: BALANCE_TABLE_ID or TRANSACTIONS_TABLE_ID
             
-            for field_name, default_value in defaults.items():
-                processed_row[field_name] = default_value
+        Returns:
+            The same list, with default values applied
+        """
+        defaults = self._get_defaults_for_target(target_table)
+        if defaults:
+            for row in rows:
+                row.update(defaults)
+        return rows
+    
+    def _get_defaults_for_target(self, target_table: str) -> Optional[Dict[str, Any]]:
+        """
+        Get schema default values for a target table ID.
+        The schema is walked once per table and the result kept on the instance.
+        
+        Args:
+            target_table: BALANCE_TABLE_ID or TRANSACTIONS_TABLE_ID
             
-            processed_rows.append(processed_row)
+        Returns:
+            Dictionary of default values, or None for an unknown table
+        """
+        defaults = self._defaults_by_table.get(target_table)
+        if defaults is not None:
+            return defaults
+        
+        if target_table == BALANCE_TABLE_ID:
+            defaults = self.config_loader.get_default_values("balance")
+        elif target_table == TRANSACTIONS_TABLE_ID:
+            defaults = self.config_loader.get_default_values("transactions")
+        else:
+            return None
         
-        logger.info(f"Applied default values to {len(processed_rows)} rows")
-        return processed_rows
+        self._defaults_by_table[target_table] = defaults
+        return defaults
     
     def _get_common_fields(self) -> Dict[str, str]:
         """
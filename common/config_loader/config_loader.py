@@ -4,12 +4,40 @@ Provides utilities to extract default values, sensitive fields, and mappings
 """
 import json
 import logging
+from functools import lru_cache
 from typing import Dict, List, Any
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson not available - stdlib json parses the same schema
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def load_schema_file(schema_path: str) -> Dict:
+    """
+    Load and parse a schema JSON file once per process.
+    
+    ConfigLoader and CentralValidator read the same schema for every parser
+    instance; the parsed dict is shared and must be treated as read-only.
+    
+    Args:
+        schema_path: Path to schema JSON file
+        
+    Returns:
+        Parsed schema dictionary
+    """
+    if orjson is not None:
+        with open(schema_path, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    with open(schema_path, 'r') as f:
+        return json.load(f)
+
+
 class ConfigLoader:
     """
     Centralized configuration loader for all parsers.
@@ -25,13 +53,15 @@ class ConfigLoader:
         """
         self.schema_path = schema_path
         self.config = self._load_config()
+        # Per-table results of the schema walks below; shared, so read-only for callers
+        self._default_values: Dict[str, Dict[str, Any]] = {}
+        self._sensitive_fields: Dict[str, List[str]] = {}
         logger.info(f"ConfigLoader initialized with schema: {schema_path}")
     
     def _load_config(self) -> Dict:
         """Load configuration from JSON file."""
         try:
-            with open(self.schema_path, 'r') as f:
-                config = json.load(f)
+            config = load_schema_file(self.schema_path)
             logger.info(f"Loaded configuration from {self.schema_path}")
             return config
         except Exception as e:
@@ -80,14 +110,18 @@ class ConfigLoader:
     
     def get_default_values(self, table_type: str) -> Dict[str, Any]:
         """
-        Extract default values from schema.
+        Extract default values from schema, once per table type.
         
         Args:
             table_type: 'balance' or 'transactions'
             
         Returns:
-            Dictionary mapping field names to default values
+            Dictionary mapping field names to default values (do not modify)
         """
+        cached = self._default_values.get(table_type)
+        if cached is not None:
+            return cached
+        
         defaults = {}
         
         # Get defaults from common fields
@@ -101,18 +135,23 @@ class ConfigLoader:
                 defaults[field["name"]] = field["default_value"]
         
         logger.debug(f"Extracted {len(defaults)} default values for {table_type}")
+        self._default_values[table_type] = defaults
         return defaults
     
     def get_sensitive_fields(self, table_type: str) -> List[str]:
         """
-        Extract sensitive field names from schema.
+        Extract sensitive field names from schema, once per table type.
         
         Args:
             table_type: 'balance' or 'transactions'
             
         Returns:
-            List of sensitive field names
+            List of sensitive field names (do not modify)
         """
+        cached = self._sensitive_fields.get(table_type)
+        if cached is not None:
+            return cached
+        
         sensitive = []
         
         # Check common fields
@@ -126,6 +165,7 @@ class ConfigLoader:
                 sensitive.append(field["name"])
         
         logger.debug(f"Found {len(sensitive)} sensitive fields for {table_type}")
+        self._sensitive_fields[table_type] = sensitive
         return sensitive
     
     def get_required_fields(self, table_type: str) -> List[str]:
@@ -5,14 +5,27 @@ Handles separate CSV files for balances and transactions
 """
 import logging
 import re
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional, Any
-from datetime import datetime
+from datetime import date
 from decimal import Decimal, InvalidOperation
-import json
+
+from common.config_loader.config_loader import load_schema_file
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _is_valid_iso_date(value: str) -> bool:
+    """Whether a string already shaped like YYYY-MM-DD is a real calendar date."""
+    # Fixed offsets instead of strptime; batches repeat the same few dates, hence the cache
+    try:
+        date(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+    except ValueError:
+        return False
+    return True
+
+
 class ValidationError(Exception):
     """Critical validation error that prevents file loading"""
     pass
@@ -43,6 +56,12 @@ class CentralValidator:
             schema_path: Path to JSON schema file
         """
         self.schema = self._load_schema(schema_path)
+        # table_type -> combined field definitions (common + table-specific)
+        self._table_schemas: Dict[str, List[Dict]] = {}
+        # table_type -> frozenset of column names a row may carry without a warning
+        self._allowed_fields: Dict[str, frozenset] = {}
+        # table_type -> flattened per-field validation rules (see _get_compiled_schema)
+        self._compiled_schemas: Dict[str, List[Tuple]] = {}
         self.validation_errors = []
         self.validation_warnings = []
         logger.info(f"CentralValidator initialized with schema: {schema_path}")
@@ -50,8 +69,7 @@ class CentralValidator:
     def _load_schema(self, schema_path: str) -> Dict:
         """Load and parse schema JSON"""
         try:
-            with open(schema_path, 'r') as f:
-                schema = json.load(f)
+            schema = load_schema_file(schema_path)
             logger.info(f"Schema loaded successfully from {schema_path}")
             return schema
         except Exception as e:
@@ -64,14 +82,18 @@ class CentralValidator:
     
     def _get_schema_for_table(self, table_type: str) -> List[Dict]:
         """
-        Get combined schema (common + table-specific fields)
+        Get combined schema (common + table-specific fields), built once per table type
         
         Args:
             table_type: 'balance' or 'transactions'
             
         Returns:
-            List of field definitions
+            List of field definitions (shared, do not modify)
         """
+        table_schema = self._table_schemas.get(table_type)
+        if table_schema is not None:
+            return table_schema
+        
         common_fields = self.schema.get("common_fields_schema", [])
         
         if table_type == "balance":
@@ -81,7 +103,69 @@ class CentralValidator:
         else:
             raise ValueError(f"Unknown table type: {table_type}")
         
-        return common_fields + table_fields
+        table_schema = self._table_schemas[table_type] = common_fields + table_fields
+        return table_schema
+
+    def _get_allowed_fields(self, table_type: str) -> frozenset:
+        """
+        Get schema field names plus internal columns, built once per table type
+        
+        Args:
+            table_type: 'balance' or 'transactions'
+            
+        Returns:
+            Frozenset of field names that are not reported as extra columns
+        """
+        allowed = self._allowed_fields.get(table_type)
+        if allowed is None:
+            schema_fields = frozenset(f["name"] for f in self._get_schema_for_table(table_type))
+            allowed = schema_fields | {"_target_table", "customer_id"}
+            self._allowed_fields[table_type] = allowed
+        return allowed
+
+    def _get_compiled_schema(self, table_type: str) -> List[Tuple]:
+        """
+        Get the table's field rules flattened into tuples, built once per table type
+        
+        Each tuple holds what validate_row needs for one field, so the schema
+        dicts are not consulted per row:
+        (name, required, not_nullable, is_string, is_date, date_required,
+         is_currency, is_amount, is_transaction_type, group_key, field_def)
+        group_key is the sorted at_least_one_of group, or None.
+        
+        Args:
+            table_type: 'balance' or 'transactions'
+            
+        Returns:
+            List of field rule tuples in schema order
+        """
+        compiled = self._compiled_schemas.get(table_type)
+        if compiled is not None:
+            return compiled
+        
+        is_transactions = table_type == "transactions"
+        compiled = []
+        for field_def in self._get_schema_for_table(table_type):
+            name = field_def["name"]
+            required = field_def.get("required", False)
+            field_type = field_def.get("type", "STRING")
+            group = field_def.get("at_least_one_of")
+            compiled.append((
+                name,
+                required,
+                field_def.get("nullable", True) is False,
+                field_type == "STRING",
+                field_type == "DATE",
+                required and not field_def.get("nullable", True),
+                name == "currency",
+                is_transactions and name == "transaction_amount",
+                is_transactions and name == "transaction_type",
+                tuple(sorted(group)) if "at_least_one_of" in field_def else None,
+                field_def,
+            ))
+        
+        self._compiled_schemas[table_type] = compiled
+        return compiled
 
     # FIELD-LEVEL VALIDATIONS
     def _validate_date_format(self, value: Any, field_name: str, is_required: bool = False) -> Optional[str]:
@@ -102,15 +186,13 @@ class CentralValidator:
                 return f"CRITICAL: Date field '{field_name}' cannot be null. File load rejected."
             return None
         
-        str_value = str(value).strip()
+        str_value = value.strip() if type(value) is str else str(value).strip()
         
         if not self.DATE_PATTERN.match(str_value):
             return f"CRITICAL: Invalid date format in '{field_name}': '{str_value}'. Expected YYYY-MM-DD. File load rejected."
         
         # Check if valid date
-        try:
-            datetime.strptime(str_value, '%Y-%m-%d')
-        except ValueError:
+        if not _is_valid_iso_date(str_value):
             return f"CRITICAL: Invalid date value in '{field_name}': '{str_value}'. File load rejected."
         
         return None
@@ -137,65 +219,6 @@ class CentralValidator:
         
         return None
     
-    def _validate_required_field(self, row: Dict, field_def: Dict) -> Optional[str]:
-        """
-        Validate required field is present and not null
-        MANDATORY CHECK - FAIL if missing or null based on schema definition
-        Uses 'required' and 'nullable' properties from JSON schema
-        
-        Args:
-            row: Row dictionary
-            field_def: Field definition from schema
-        
-        Returns:
-            Error message if invalid, None if valid
-        """
-        field_name = field_def["name"]
-        
-        # Check if field is marked as required in schema
-        if field_def.get("required", False):
-            # Field must be present
-            if field_name not in row:
-                return f"CRITICAL: Required field missing: '{field_name}'. File load rejected."
-            
-            value = row[field_name]
-            
-            # Check nullable property from schema
-            if field_def.get("nullable", True) is False:
-                # Field cannot be null or empty
-                if value is None or (isinstance(value, str) and value.strip() == ""):
-                    return f"CRITICAL: Required field '{field_name}' cannot be null or empty. File load rejected."
-        
-        return None
-    
-    def _validate_data_type(self, value: Any, field_def: Dict) -> Optional[str]:
-        """
-        Validate field data type matches schema
-        
-        Args:
-            value: Value to validate
-            field_def: Field definition from schema
-        
-        Returns:
-            Error message if invalid, None if valid
-        """
-        if value is None:
-            return None
-        
-        field_name = field_def["name"]
-        expected_type = field_def.get("type", "STRING")
-        
-        if expected_type == "STRING":
-            # Accept strings, numbers (int, float), and convert them to string
-            if not isinstance(value, (str, int, float, bool)):
-                return f"Invalid data type in field '{field_name}': expected STRING, got {type(value).__name__}."
-        
-        elif expected_type == "DATE":
-            is_required = field_def.get("required", False) and not field_def.get("nullable", True)
-            return self._validate_date_format(value, field_name, is_required)
-        
-        return None
-    
     def _validate_at_least_one_of(self, row: Dict, field_def: Dict) -> Optional[str]:
         """
         Validate at least one field from a group is present
@@ -425,64 +448,64 @@ class CentralValidator:
         errors = []
         warnings = []
         
-        schema = self._get_schema_for_table(table_type)
-        
         # Track at_least_one_of groups to validate only once
         validated_groups = set()
         
         # Field-level validations
-        for field_def in schema:
-            field_name = field_def["name"]
-            value = row.get(field_name)
+        for (field_name, required, not_nullable, is_string, is_date, date_required,
+             is_currency, is_amount, is_transaction_type, group_key, field_def) in self._get_compiled_schema(table_type):
             
             # Required field check (MANDATORY)
-            error = self._validate_required_field(row, field_def)
-            if error:
-                errors.append(error)
-                continue
-            
-            # Skip validation if field not present and not required
             if field_name not in row:
+                if required:
+                    errors.append(f"CRITICAL: Required field missing: '{field_name}'. File load rejected.")
+                # Skip validation if field not present and not required
                 continue
             
+            value = row[field_name]
+            
+            if required and not_nullable:
+                # Field cannot be null or empty
+                if value is None or (isinstance(value, str) and value.strip() == ""):
+                    errors.append(f"CRITICAL: Required field '{field_name}' cannot be null or empty. File load rejected.")
+                    continue
+            
             # Data type validation
-            error = self._validate_data_type(value, field_def)
-            if error:
-                errors.append(error)
+            if is_string and value is not None:
+                # Accept strings, numbers (int, float), and convert them to string
+                if not isinstance(value, (str, int, float, bool)):
+                    errors.append(f"Invalid data type in field '{field_name}': expected STRING, got {type(value).__name__}.")
             
-            # Date format validation for date fields (MANDATORY for required dates)
-            if field_def.get("type") == "DATE":
-                is_required = field_def.get("required", False) and not field_def.get("nullable", True)
-                error = self._validate_date_format(value, field_name, is_required)
+            # Date type and format validation, once per date field (MANDATORY for required dates)
+            if is_date:
+                error = self._validate_date_format(value, field_name, date_required)
                 if error:
                     errors.append(error)
             
             # Currency validation (MANDATORY)
-            if field_name == "currency":
+            if is_currency:
                 error = self._validate_currency(value, field_name)
                 if error:
                     errors.append(error)
             
             # Transaction amount validation (MANDATORY for transactions)
-            if field_name == "transaction_amount" and table_type == "transactions":
+            if is_amount:
                 error = self._validate_transaction_amount(value, field_name)
                 if error:
                     errors.append(error)
             
             # Transaction type validation (MANDATORY for transactions)
-            if field_name == "transaction_type" and table_type == "transactions":
+            if is_transaction_type:
                 error = self._validate_transaction_type(value, field_name)
                 if error:
                     errors.append(error)
             
             # At least one of validation (check only once per group) (MANDATORY)
-            if "at_least_one_of" in field_def:
-                group_key = tuple(sorted(field_def["at_least_one_of"]))
-                if group_key not in validated_groups:
-                    validated_groups.add(group_key)
-                    error = self._validate_at_least_one_of(row, field_def)
-                    if error:
-                        errors.append(error)
+            if group_key is not None and group_key not in validated_groups:
+                validated_groups.add(group_key)
+                error = self._validate_at_least_one_of(row, field_def)
+                if error:
+                    errors.append(error)
         
         # Row-level validations
         bal_error, bal_warning = self._validate_balance_integrity(row, all_rows)
@@ -492,8 +515,8 @@ class CentralValidator:
             warnings.append(bal_warning)
         
         # Check for extra fields not in schema
-        schema_fields = {f["name"] for f in schema}
-        extra_fields = set(row.keys()) - schema_fields - {"_target_table", "customer_id"}
+        # Set difference on the key view runs in C instead of a per-key Python loop
+        extra_fields = row.keys() - self._get_allowed_fields(table_type)
         if extra_fields:
             warnings.append(f"Extra columns detected: {', '.join(sorted(extra_fields))}. Ignored during ingestion.")
         
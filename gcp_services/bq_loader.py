@@ -1,5 +1,15 @@
+import io
+import json
 import logging
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
+
+try:
+    import orjson
+except ImportError:  # orjson not available - stdlib json produces the same NDJSON
+    orjson = None
 from google.cloud import bigquery
 from google.api_core.exceptions import NotFound
 from common.env_variables.settings import PROJECT_ID
@@ -7,13 +17,31 @@ from common.env_variables.settings import DATASET_ID
 
 logger = logging.getLogger(__name__)
 
+# Rows per insertAll request; BigQuery recommends ~500 and caps a request at 10 MB
+INSERT_BATCH_SIZE = 500
+# insertAll requests in flight at once per table
+INSERT_MAX_WORKERS = 8
+# Attempts per insert batch, and the delay before the first retry (doubled for each later one)
+INSERT_MAX_ATTEMPTS = 3
+INSERT_RETRY_BACKOFF_SECONDS = 1.0
+# Tables with more rows than this are loaded with a single load job instead of streaming
+LOAD_JOB_MIN_ROWS = 1000
+
 
-def load_rows_to_bq(rows: List[Dict]) -> int:
+def load_rows_to_bq(rows: List[Dict], batch_size: int = INSERT_BATCH_SIZE,
+                    max_workers: int = INSERT_MAX_WORKERS) -> int:
     """
     Loads a list of rows into their respective BigQuery tables.
     
+    Tables with more than LOAD_JOB_MIN_ROWS rows are written by one load job;
+    smaller ones are sent as batch_size-row insertAll requests, with up to
+    max_workers requests in flight at once. Failed batches are retried with
+    backoff; batches that still fail are reported by row range.
+    
     Args:
         rows: List of dictionaries, each containing a '_target_table' key.
+        batch_size: Maximum rows per insert request
+        max_workers: Maximum concurrent insert requests
         
     Returns:
         Number of rows loaded
@@ -39,18 +67,130 @@ def load_rows_to_bq(rows: List[Dict]) -> int:
         logger.info(f"Loading {len(table_rows)} rows into table '{table_name}'...")
         
         try:
-            client.get_table(table_ref)
+            table = client.get_table(table_ref)
         except NotFound:
             logger.error(f"BigQuery table '{table_name}' not found in dataset '{DATASET_ID}'.")
             raise RuntimeError(f"Target table '{table_name}' does not exist.")
         
-        errors = client.insert_rows_json(table_ref, table_rows)
-        if errors:
-            for error in errors:
-                logger.error(f"BigQuery insert error for table '{table_name}': {error}")
-            raise RuntimeError(f"Failed to load data into BigQuery table '{table_name}'.")
+        if len(table_rows) > LOAD_JOB_MIN_ROWS:
+            _load_rows_with_job(client, table, table_name, table_rows)
+            total_loaded += len(table_rows)
+            continue
         
+        _insert_rows_in_batches(client, table_ref, table_name, table_rows, batch_size, max_workers)
         total_loaded += len(table_rows)
     
     logger.info(f"Successfully loaded {total_loaded} rows into BigQuery.")
-    return total_loaded
\ No newline at end of file
+    return total_loaded
+
+
+def _insert_rows_in_batches(client: bigquery.Client, table_ref, table_name: str,
+                            rows: List[Dict], batch_size: int, max_workers: int) -> None:
+    """
+    Streams rows into a table as concurrent insertAll requests, retrying failed batches.
+    
+    Each row gets an insert ID derived from this load and its index, so a
+    retried batch that did land the first time is deduplicated by BigQuery.
+    
+    Args:
+        client: BigQuery client
+        table_ref: Target table reference
+        table_name: Table name for logging
+        rows: Rows to insert
+        batch_size: Maximum rows per insert request
+        max_workers: Maximum concurrent insert requests
+        
+    Raises:
+        RuntimeError: If any batch still fails after INSERT_MAX_ATTEMPTS attempts;
+            the message lists the failed row ranges (other batches are committed)
+    """
+    load_id = uuid.uuid4().hex
+    
+    def insert_batch(offset: int) -> list:
+        batch = rows[offset:offset + batch_size]
+        row_ids = [f"{load_id}-{index}" for index in range(offset, offset + len(batch))]
+        try:
+            # Each request is also retried on transient errors by the client's default retry
+            return client.insert_rows_json(table_ref, batch, row_ids=row_ids)
+        except Exception as e:
+            return [f"Insert request failed: {e}"]
+    
+    pending = list(range(0, len(rows), batch_size))  # offsets of batches still to insert
+    batch_errors = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+        for attempt in range(1, INSERT_MAX_ATTEMPTS + 1):
+            if attempt > 1:
+                delay = INSERT_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 2)
+                logger.warning(f"Retrying {len(pending)} failed batch(es) for table '{table_name}' "
+                               f"in {delay:g}s (attempt {attempt}/{INSERT_MAX_ATTEMPTS})")
+                time.sleep(delay)
+            
+            batch_errors = {
+                offset: errors
+                for offset, errors in zip(pending, executor.map(insert_batch, pending))
+                if errors
+            }
+            pending = sorted(batch_errors)
+            if not pending:
+                return
+    
+    failed_ranges = []
+    failed_rows = 0
+    for offset in pending:
+        end = min(offset + batch_size, len(rows))
+        failed_ranges.append(f"{offset}-{end - 1}")
+        failed_rows += end - offset
+        for error in batch_errors[offset]:
+            logger.error(f"BigQuery insert error for table '{table_name}' (rows {offset}-{end - 1}): {error}")
+    
+    raise RuntimeError(
+        f"Failed to load data into BigQuery table '{table_name}': rows {', '.join(failed_ranges)} "
+        f"failed after {INSERT_MAX_ATTEMPTS} attempts; the other "
+        f"{len(rows) - failed_rows} of {len(rows)} rows were inserted."
+    )
+
+
+def _load_rows_with_job(client: bigquery.Client, table: bigquery.Table,
+                        table_name: str, rows: List[Dict]) -> None:
+    """
+    Appends rows to a table with one batch load job and waits for it.
+    
+    Args:
+        client: BigQuery client
+        table: Target table (its schema is used for the load)
+        table_name: Table name for logging
+        rows: Rows to append
+    """
+    job_config = bigquery.LoadJobConfig(
+        source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+        schema=table.schema,
+        write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+    )
+    logger.info(f"Using load job for {len(rows)} rows into table '{table_name}'")
+    
+    try:
+        payload = _to_ndjson(rows)
+    except TypeError as e:
+        # orjson rejects non-str keys, e.g. the None restkey of CSV rows with extra values
+        logger.error(f"Could not serialize rows for table '{table_name}': {e}")
+        raise RuntimeError(f"Failed to load data into BigQuery table '{table_name}'.") from e
+    
+    job = client.load_table_from_file(io.BytesIO(payload), table, job_config=job_config)
+    try:
+        job.result()
+    except Exception as e:
+        for error in job.errors or []:
+            logger.error(f"BigQuery load error for table '{table_name}': {error}")
+        raise RuntimeError(f"Failed to load data into BigQuery table '{table_name}'.") from e
+
+
+def _to_ndjson(rows: List[Dict]) -> bytes:
+    """
+    Serialize rows as newline-delimited JSON for a load job.
+    
+    The json fallback gives the same output as orjson only for rows whose keys
+    are all str; orjson raises TypeError for any other key.
+    """
+    if orjson is not None:
+        return b"\n".join(map(orjson.dumps, rows))
+    return "\n".join(json.dumps(row, ensure_ascii=False) for row in rows).encode("utf-8")
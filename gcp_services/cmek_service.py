@@ -3,7 +3,8 @@ KMS Encryption module using organisation_biz_id for key lookup
 """
 import base64
 import logging
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from google.cloud import kms
 from common.env_variables.settings import PROJECT_ID
 from common.env_variables.settings import KEY_RING
@@ -11,13 +12,33 @@ from common.env_variables.settings import LOCATION
 
 logger = logging.getLogger(__name__)
 
+# KMS calls are network-bound, so threads overlap round-trips despite the GIL.
+# Each worker has at most one request in flight, so this also bounds the request
+# rate one encryptor can put against the project's KMS cryptographic request quota.
+ENCRYPT_MAX_WORKERS = 32
+
 
 class KmsEncryptor:
     """Handles encryption using KMS with key caching for performance."""
     
-    def __init__(self):
+    def __init__(self, max_workers: int = ENCRYPT_MAX_WORKERS):
         self.kms_client = kms.KeyManagementServiceClient()
         self._key_cache: Dict[str, str] = {}  # {organisation_biz_id: key_name}
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None  # shared by all encrypt_rows calls
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Returns the encryptor's thread pool, starting it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers,
+                                                thread_name_prefix="kms-encrypt")
+        return self._executor
+    
+    def close(self) -> None:
+        """Shuts down the encryption thread pool, if it was started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
     
     def _find_and_cache_key(self, organisation_biz_id: str) -> str:
         """Finds and caches the CMEK key for an organisation to reduce API calls."""
@@ -46,7 +67,10 @@ class KmsEncryptor:
         if plaintext is None or (isinstance(plaintext, str) and plaintext.strip() == ""):
             return plaintext
         
-        key_name = self._find_and_cache_key(organisation_biz_id)
+        return self._encrypt_with_key(self._find_and_cache_key(organisation_biz_id), plaintext)
+    
+    def _encrypt_with_key(self, key_name: str, plaintext: str) -> str:
+        """Encrypts a non-empty plaintext value with an already resolved KMS key."""
         response = self.kms_client.encrypt(
             request={"name": key_name, "plaintext": str(plaintext).encode("utf-8")}
         )
@@ -69,4 +93,63 @@ class KmsEncryptor:
                     raise
         
         # organisation_biz_id remains in the row (it's a required field in the schema)
-        return encrypted_row
\ No newline at end of file
+        return encrypted_row
+    
+    def encrypt_rows(self, rows: List[Dict], sensitive_fields: List[str]) -> List[Dict]:
+        """
+        Encrypts sensitive fields across many rows with concurrent KMS calls.
+        
+        Same result as calling encrypt_row per row, but the key is resolved
+        once per organisation and the per-value KMS round-trips run in the
+        encryptor's shared thread pool instead of one after another. Rows with
+        nothing to encrypt are returned as they are rather than copied. On the
+        first failure, requests that have not started yet are cancelled.
+        """
+        encrypted_rows = []
+        tasks: List[Tuple[Dict, str, str, str]] = []  # (encrypted_row, field, key_name, plaintext)
+        
+        for row in rows:
+            organisation_biz_id = row.get("organisation_biz_id")
+            if not organisation_biz_id:
+                raise ValueError("Row is missing 'organisation_biz_id' for encryption key lookup.")
+            
+            key_name = None
+            # Copied only once a value needs encrypting; other rows are passed through
+            encrypted_row = row
+            for field in sensitive_fields:
+                if field in row:
+                    plaintext = row[field]
+                    # None and empty strings are left as they are
+                    if plaintext is None or (isinstance(plaintext, str) and plaintext.strip() == ""):
+                        continue
+                    if key_name is None:
+                        # Resolve the key here so worker threads never touch the key cache
+                        key_name = self._find_and_cache_key(organisation_biz_id)
+                        encrypted_row = row.copy()
+                    tasks.append((encrypted_row, field, key_name, plaintext))
+            encrypted_rows.append(encrypted_row)
+        
+        if not tasks:
+            return encrypted_rows
+        
+        executor = self._get_executor()
+        futures = [executor.submit(self._encrypt_task, task) for task in tasks]
+        try:
+            for (encrypted_row, field, _, _), future in zip(tasks, futures):
+                encrypted_row[field] = future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        
+        # organisation_biz_id remains in the rows (it's a required field in the schema)
+        return encrypted_rows
+    
+    def _encrypt_task(self, task: Tuple[Dict, str, str, str]) -> Optional[str]:
+        """Encrypts one (row, field) value of an encrypt_rows batch."""
+        encrypted_row, field, key_name, plaintext = task
+        try:
+            return self._encrypt_with_key(key_name, plaintext)
+        except Exception:
+            logger.error(f"Encryption failed for field '{field}' for organisation '{encrypted_row.get('organisation_biz_id')}'", exc_info=True)
+            raise
@@ -5,7 +5,7 @@ import logging
 from google.cloud import storage as gcs
 from google.api_core.exceptions import NotFound
 from common.env_variables.settings import PROJECT_ID
-from typing import Tuple, Optional
+from typing import BinaryIO, Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -131,6 +131,41 @@ def read_file_from_gcs(gcs_path: str) -> str:
         raise
 
 
+def open_file_stream_from_gcs(gcs_path: str) -> BinaryIO:
+    """
+    Opens a file in GCS as a seekable binary stream.
+    
+    The content is downloaded in chunks as the stream is read, so large files
+    can be parsed without holding the whole download in memory.
+    
+    Args:
+        gcs_path: The GCS path in the format 'bucket_name/blob_name'.
+        
+    Returns:
+        Binary file object; the caller is responsible for closing it.
+    """
+    if "/" not in gcs_path:
+        raise ValueError("Invalid GCS path format. Expected 'bucket_name/blob_name'.")
+    
+    bucket_name, blob_name = gcs_path.split("/", 1)
+    logger.info(f"Opening file stream from GCS: gs://{bucket_name}/{blob_name}")
+    
+    try:
+        client = gcs.Client(project=PROJECT_ID)
+        bucket = client.bucket(bucket_name)
+        blob = bucket.blob(blob_name)
+        # open() makes no request, so a missing blob would otherwise only
+        # surface as a raw NotFound on the caller's first read
+        blob.reload()
+        return blob.open('rb')
+    except NotFound:
+        logger.error(f"File not found at GCS path: gs://{gcs_path}")
+        raise FileNotFoundError(f"File not found at GCS path: gs://{gcs_path}")
+    except Exception as e:
+        logger.error(f"Failed to open GCS path gs://{gcs_path}: {e}", exc_info=True)
+        raise
+
+
 def move_file_in_gcs(bucket_name: str, source_blob_name: str, 
                      destination_blob_name: str) -> None:
     """